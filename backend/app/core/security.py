@@ -6,14 +6,22 @@ Handles password hashing and JWT tokens
 Simple functions:
 1. hash_password() - Hash a password
 2. verify_password() - Check if password is correct  
-3. create_token() - Create JWT token for user
-4. decode_token() - Get email from JWT token
+3. password_needs_rehash() - Check if a stored hash should be upgraded
+4. create_token() - Create JWT token for user
+5. decode_token() - Get email from JWT token
 """
 
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+import jwt
+from jwt import PyJWTError as JWTError
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from fastapi import HTTPException
+import bcrypt
+import hashlib
+import threading
+import time
 import os
 
 # Configuration
@@ -21,8 +29,25 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT decoding: built once at import instead of on every request
+SECRET_KEY_BYTES = SECRET_KEY.encode()
+_jwt = jwt.PyJWT()
+_ALGORITHMS = [ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp", "sub"], "verify_signature": True}
+
+# Password hashing (Argon2id, tune so one hash takes ~250ms on the server)
+# Older bcrypt hashes ("$2b$...") are still accepted and upgraded on login
+_password_hasher = PasswordHasher(
+    time_cost=int(os.getenv("ARGON2_TIME_COST", "3")),
+    memory_cost=int(os.getenv("ARGON2_MEMORY_COST", "65536")),  # KiB (64 MiB)
+    parallelism=int(os.getenv("ARGON2_PARALLELISM", "1")),
+)
+
+# Recently verified tokens: {sha256(token)[:16]: (email, exp)}
+# Only successful decodes are cached, and never past the token's own "exp"
+# TTLCache isn't thread-safe (sync endpoints run in the threadpool), so every access takes the lock
+_token_cache = TTLCache(maxsize=10_000, ttl=30)
+_token_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
@@ -32,7 +57,7 @@ def hash_password(password: str) -> str:
     Example:
         hashed = hash_password("mypassword123")
     """
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -42,7 +67,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Example:
         is_valid = verify_password("mypassword123", hashed)
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith("$2"):
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check if a stored hash is bcrypt or uses outdated Argon2 parameters
+    
+    Example:
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = hash_password(password)
+    """
+    return hashed_password.startswith("$2") or _password_hasher.check_needs_rehash(hashed_password)
 
 
 def create_token(email: str) -> str:
@@ -60,7 +102,7 @@ def create_token(email: str) -> str:
         "exp": expire  # "exp" is standard JWT field for expiration
     }
     
-    token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+    token = jwt.encode(data, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return token
 
 
@@ -68,18 +110,30 @@ def decode_token(token: str) -> str:
     """
     Decode a JWT token and return the email
     Raises HTTPException if token is invalid or expired
+    Valid tokens are cached for up to 30 seconds (never past their expiry)
     
     Example:
         email = decode_token("eyJ...")
     """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            email, exp = cached
+            if exp > time.time():
+                return email
+            _token_cache.pop(key, None)
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _jwt.decode(token, SECRET_KEY_BYTES, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
         email = payload.get("sub")
         
         if email is None:
             raise HTTPException(status_code=401, detail="Invalid token")
         
-        return email
-        
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
+
+    with _token_cache_lock:
+        _token_cache[key] = (email, payload["exp"])
+    return email
@@ -9,9 +9,17 @@ Usage:
     @app.get("/example")
     def example(db: Session = Depends(get_db)):
         # use db here
+
+Hot read paths use the async (asyncpg) session instead:
+    from app.db.database import get_async_db
+    
+    @app.get("/example")
+    async def example(db: AsyncSession = Depends(get_async_db)):
+        result = await db.execute(select(...))
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -22,11 +30,62 @@ DATABASE_URL = os.getenv(
     "postgresql://cms_user:cms_password@db:5432/cms_db"  # Default for Docker
 )
 
+# Pool limits per engine, derived from a connection budget shared by all API processes:
+#   processes * 2 engines (sync + async) * (pool_size + max_overflow) <= DB_CONNECTION_BUDGET
+# processes is WEB_CONCURRENCY, or 2*CPU+1 like the Dockerfile. The default budget of 80
+# leaves 20 of Postgres' 100 max_connections for the publishing worker (2), psql and
+# superuser slots. Each engine gets at least 1 + 1, so past ~40 processes raise the
+# budget (and max_connections) or add pgbouncer. DB_POOL_SIZE / DB_MAX_OVERFLOW override.
+CONNECTION_BUDGET = int(os.getenv("DB_CONNECTION_BUDGET", "80"))
+_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+API_PROCESSES = int(os.getenv("WEB_CONCURRENCY") or 2 * _CPUS + 1)
+_PER_ENGINE = max(2, CONNECTION_BUDGET // (API_PROCESSES * 2))
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or (_PER_ENGINE + 1) // 2)
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW") or _PER_ENGINE // 2)
+
 # Create database engine
-engine = create_engine(DATABASE_URL)
+# Connections are pooled and reused; pre-ping drops connections that
+# Postgres closed while idle, and recycle retires them every 30 minutes
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,  # Reuse the most recent (warm) connection first
+    query_cache_size=1200,  # Compiled-SQL cache, sized to hold every statement the app issues
+    # Multi-row INSERTs go out as one INSERT ... VALUES (...), (...) per 1000 rows, and
+    # executemany UPDATE/DELETE (worker, seed) use psycopg2's execute_batch instead of a loop
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects keep their values after commit, so returning
+# a just-created row doesn't cost another SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Async engine on asyncpg, which prepares statements server-side and caches
+# them per connection, so repeat queries skip Postgres' parse/plan step
+# Behind pgbouncer in transaction mode, set DB_STATEMENT_CACHE_SIZE=0
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    connect_args={
+        "statement_cache_size": STATEMENT_CACHE_SIZE,  # asyncpg's own prepared statements
+        "prepared_statement_cache_size": min(STATEMENT_CACHE_SIZE, 512),  # SQLAlchemy dialect's
+    },
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 
 # Base class for all models
 Base = declarative_base()
@@ -47,3 +106,18 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Get async database session (asyncpg)
+    
+    Use this as a FastAPI dependency in async endpoints:
+        async def my_endpoint(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(...))
+    
+    Relationships are not lazy-loaded on async sessions, so
+    eager-load (selectinload/joinedload) everything you format
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -13,23 +13,75 @@ This file contains all API endpoints organized in sections:
 7. Public Catalog API (no auth required)
 """
 
-from fastapi import FastAPI, Depends, HTTPException, Header
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import Optional
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import text, select, update, func, exists, true, tuple_, bindparam, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload, joinedload, load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from uuid import UUID
+import asyncio
+import base64
+import hashlib
+import orjson
 import os
+import threading
 
 # Import our modules
-from app.models.models import *
-from app.db.database import get_db, engine, Base
-from app.core.security import hash_password, verify_password, create_token, decode_token
+from app.models.models import (
+    User, UserRole, Topic, Program, ProgramStatus, ProgramAsset, Term, Lesson, LessonStatus,
+    LessonAsset, AssetType, published_programs_view, create_schema,
+    REFRESH_PUBLISHED_PROGRAMS, NOTIFY_LESSON_SCHEDULED
+)
+from app.db.database import SessionLocal, AsyncSessionLocal, get_db, get_async_db, engine
+from app.core.security import hash_password, verify_password, password_needs_rehash, create_token, decode_token
+from app.schemas.schemas import (
+    UserCreate, UserLogin, TopicCreate, TopicUpdate, AssetCreate, ProgramCreate, ProgramUpdate,
+    TermCreate, ProgramTermCreate, LessonCreate, TermLessonCreate, LessonUpdate, LessonPublish
+)
+
+def json_default(value):
+    """orjson fallback: asyncpg returns ids as its own UUID subclass, which orjson rejects"""
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def json_dumps(content) -> bytes:
+    """orjson.dumps that also handles asyncpg UUIDs"""
+    return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class JSONResponse(ORJSONResponse):
+    """ORJSONResponse that also handles asyncpg UUIDs"""
+    def render(self, content) -> bytes:
+        return json_dumps(content)
 
-# Create all database tables
-Base.metadata.create_all(bind=engine)
 
 # Initialize app
-app = FastAPI(title="CMS API", version="1.0.0")
+# orjson serializes datetime (and, through json_default, UUID) natively, so formatters return them as-is
+app = FastAPI(title="CMS API", version="1.0.0", default_response_class=JSONResponse)
+
+# Password hashing is CPU-bound, so it gets its own threads instead of blocking the event loop
+_password_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+@app.on_event("startup")
+def init_db():
+    """
+    Create database tables on startup (only when RUN_MIGRATIONS=1)
+    Leave it unset for multi-process API deployments: the worker (or seed.py) creates
+    the schema once instead of every uvicorn process doing it on boot
+    """
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        create_schema(engine)
 
 # Enable CORS so frontend can call API
 app.add_middleware(
@@ -39,8 +91,9 @@ app.add_middleware(
         "http://localhost:3000",  # optional
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 
@@ -48,25 +101,133 @@ app.add_middleware(
 # HELPER FUNCTIONS
 #================================================================
 
-def get_current_user(authorization: str, db: Session) -> User:
-    """Get user from JWT token"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Not authenticated")
+class CurrentUser(NamedTuple):
+    """Lightweight snapshot of the logged-in user (safe to cache)"""
+    id: UUID
+    email: str
+    role: UserRole
+    is_active: bool
+    full_name: Optional[str]
+    created_at: datetime
+
+
+# Logged-in users by email, so most requests skip the users table
+# TTLCache isn't thread-safe and sync endpoints (threadpool) invalidate it, so every access takes the lock
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_user(email: str):
+    """Drop a user from the cache (call after changing or deleting them)"""
+    with _user_cache_lock:
+        _user_cache.pop(email, None)
+
+
+# Serialized /catalog/programs pages: {(language, topic, cursor, limit): (orjson bytes, etag)}
+# Per process, so changes made by the worker show up once the TTL runs out
+# Cleared from sync endpoints (threadpool), so like _user_cache every access takes the lock
+_catalog_cache = TTLCache(maxsize=1000, ttl=60)
+_catalog_cache_lock = threading.Lock()
+
+
+def invalidate_catalog():
+    """Drop all cached catalog pages (call after changing programs, lessons or topics)"""
+    with _catalog_cache_lock:
+        _catalog_cache.clear()
+
+
+def refresh_published_programs(db: Session):
+    """Rebuild mv_published_programs (call after publish state or language changes)"""
+    db.execute(REFRESH_PUBLISHED_PROGRAMS)
+    db.commit()
+
+
+# Public catalog responses may be cached by browsers/CDNs for as long as our own cache
+_CATALOG_CACHE_CONTROL = "public, max-age=60"
+
+
+def make_etag(data: bytes) -> str:
+    """Short strong ETag (quoted, as HTTP requires)"""
+    return '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (t.strip().removeprefix("W/") for t in header.split(","))
+
+
+def catalog_response(request: Request, body: bytes, etag: str) -> Response:
+    """JSON response with ETag/Cache-Control, or an empty 304 if the client is up to date"""
+    headers = {"ETag": etag, "Cache-Control": _CATALOG_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# Reads "Authorization: Bearer <token>"; returns None instead of raising so we control the 401
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    creds: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> CurrentUser:
+    """
+    Get user from JWT token
+    FastAPI runs it once per request, however many dependencies ask for it,
+    and a session is only opened when the user isn't cached yet
     
-    token = authorization.replace("Bearer ", "")
-    email = decode_token(token)
-    user = db.query(User).filter(User.email == email).first()
+    Use this as a FastAPI dependency (works in sync and async endpoints):
+        def my_endpoint(user: CurrentUser = Depends(get_current_user)):
+    """
+    if creds is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
     
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
+    email = decode_token(creds.credentials)
+    
+    with _user_cache_lock:
+        user = _user_cache.get(email)
+    if user is None:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(User.id, User.email, User.role, User.is_active, User.full_name, User.created_at)
+                .where(User.email == email)
+            )
+            row = result.first()
+        
+        if not row:
+            raise HTTPException(status_code=401, detail="User not found")
+        
+        user = CurrentUser(*row)
+        with _user_cache_lock:
+            _user_cache[email] = user
     
     return user
 
 
-def require_role(user: User, allowed_roles: list):
-    """Check if user has required role"""
-    if user.role not in allowed_roles:
-        raise HTTPException(status_code=403, detail="Not authorized")
+def require_roles(*roles: UserRole):
+    """
+    Build a dependency that returns the current user if they have one of the roles
+    
+    Use it in place of get_current_user:
+        def my_endpoint(user: CurrentUser = Depends(require_roles(UserRole.admin))):
+    """
+    allowed_roles = frozenset(roles)
+    
+    # async so the check runs inline instead of taking a threadpool hop
+    async def check_role(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+        if user.role not in allowed_roles:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return user
+    
+    return check_role
+
+
+# Role checks used by the protected endpoints
+require_editor = require_roles(UserRole.admin, UserRole.editor)
+require_admin = require_roles(UserRole.admin)
 
 
 def format_program(program: Program) -> dict:
@@ -74,21 +235,19 @@ def format_program(program: Program) -> dict:
     # Convert assets to nested dict: {language: {variant: url}}
     assets = {}
     for asset in program.assets:
-        if asset.language not in assets:
-            assets[asset.language] = {}
-        assets[asset.language][asset.variant.value] = asset.url
+        assets.setdefault(asset.language, {})[asset.variant.value] = asset.url
     
     return {
-        "id": str(program.id),
+        "id": program.id,
         "title": program.title,
         "description": program.description,
         "language_primary": program.language_primary,
         "languages_available": program.languages_available,
         "status": program.status.value,
-        "published_at": program.published_at.isoformat() if program.published_at else None,
-        "created_at": program.created_at.isoformat(),
-        "updated_at": program.updated_at.isoformat(),
-        "topics": [{"id": str(t.id), "name": t.name, "created_at": t.created_at.isoformat()} for t in program.topics],
+        "published_at": program.published_at,
+        "created_at": program.created_at,
+        "updated_at": program.updated_at,
+        "topics": [{"id": t.id, "name": t.name, "created_at": t.created_at} for t in program.topics],
         "assets": assets
     }
 
@@ -98,13 +257,11 @@ def format_lesson(lesson: Lesson) -> dict:
     # Convert assets to nested dict
     assets = {}
     for asset in lesson.assets:
-        if asset.language not in assets:
-            assets[asset.language] = {}
-        assets[asset.language][asset.variant.value] = asset.url
+        assets.setdefault(asset.language, {})[asset.variant.value] = asset.url
     
     return {
-        "id": str(lesson.id),
-        "term_id": str(lesson.term_id),
+        "id": lesson.id,
+        "term_id": lesson.term_id,
         "lesson_number": lesson.lesson_number,
         "title": lesson.title,
         "content_type": lesson.content_type.value,
@@ -116,23 +273,52 @@ def format_lesson(lesson: Lesson) -> dict:
         "subtitle_languages": lesson.subtitle_languages,
         "subtitle_urls_by_language": lesson.subtitle_urls_by_language,
         "status": lesson.status.value,
-        "publish_at": lesson.publish_at.isoformat() if lesson.publish_at else None,
-        "published_at": lesson.published_at.isoformat() if lesson.published_at else None,
-        "created_at": lesson.created_at.isoformat(),
-        "updated_at": lesson.updated_at.isoformat(),
+        "publish_at": lesson.publish_at,
+        "published_at": lesson.published_at,
+        "created_at": lesson.created_at,
+        "updated_at": lesson.updated_at,
         "assets": assets
     }
 
 
+def insert_unique(db: Session, model, index_elements: list, **values):
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING the new row (not committed)
+    Returns None if a row with the same unique key already exists, so the
+    unique index does the duplicate check atomically in a single round trip
+    """
+    stmt = pg_insert(model).values(**values).on_conflict_do_nothing(index_elements=index_elements)
+    return db.execute(stmt.returning(model)).scalar_one_or_none()
+
+
+def load_topics(db: Session, topic_ids: Optional[list]) -> list:
+    """Fetch topics by id in one query, 400 if any id is unknown (no query when empty)"""
+    ids = set(topic_ids or [])
+    if not ids:
+        return []
+    
+    topics = db.execute(select(Topic).where(Topic.id.in_(ids))).scalars().all()
+    missing = ids - {t.id for t in topics}
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Unknown topic ids: {', '.join(sorted(map(str, missing)))}")
+    return topics
+
+
 #================================================================
 # 1. HEALTH CHECK
 #================================================================
 
+# Health probe statements (compiled once); a hung database can't stall the probe past 500ms
+_PING_TIMEOUT = text("SET LOCAL statement_timeout = '500ms'")
+_PING = text("SELECT 1")
+
+
 @app.get("/health")
 def health_check(db: Session = Depends(get_db)):
     """Check if API and database are working"""
     try:
-        db.execute("SELECT 1")
+        db.execute(_PING_TIMEOUT)
+        db.execute(_PING).scalar()
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         return {"status": "error", "database": "disconnected", "error": str(e)}
@@ -143,37 +329,44 @@ def health_check(db: Session = Depends(get_db)):
 #================================================================
 
 @app.post("/api/auth/login")
-def login(data: dict, db: Session = Depends(get_db)):
+async def login(data: UserLogin, db: Session = Depends(get_db)):
     """Login and get JWT token"""
-    email = data.get("email")
-    password = data.get("password")
+    email = data.email
+    password = data.password
     
     # Find user
-    user = db.query(User).filter(User.email == email).first()
+    user = await run_in_threadpool(lambda: db.execute(
+        select(User).options(load_only(User.email, User.hashed_password)).where(User.email == email)
+    ).scalar_one_or_none())
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     # Check password
-    if not verify_password(password, user.hashed_password):
+    loop = asyncio.get_running_loop()
+    is_valid = await loop.run_in_executor(_password_pool, verify_password, password, user.hashed_password)
+    if not is_valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    # Upgrade bcrypt (or outdated Argon2) hashes now that we know the password
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await loop.run_in_executor(_password_pool, hash_password, password)
+        await run_in_threadpool(db.commit)
+    
     # Create token
     token = create_token(user.email)
     return {"access_token": token, "token_type": "bearer"}
 
 
 @app.get("/api/auth/me")
-def get_me(authorization: str = Header(None), db: Session = Depends(get_db)):
+def get_me(user: CurrentUser = Depends(get_current_user)):
     """Get current user info"""
-    user = get_current_user(authorization, db)
-    
     return {
-        "id": str(user.id),
+        "id": user.id,
         "email": user.email,
         "full_name": user.full_name,
         "role": user.role.value,
         "is_active": user.is_active,
-        "created_at": user.created_at.isoformat()
+        "created_at": user.created_at
     }
 
 
@@ -182,24 +375,28 @@ def get_me(authorization: str = Header(None), db: Session = Depends(get_db)):
 #================================================================
 
 @app.get("/api/topics")
-def list_topics(db: Session = Depends(get_db)):
-    """Get all topics"""
-    topics = db.query(Topic).all()
-    return [{"id": str(t.id), "name": t.name, "created_at": t.created_at.isoformat()} for t in topics]
+def list_topics(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Get all topics (paginated with limit/offset)"""
+    topics = db.execute(
+        select(Topic.id, Topic.name, Topic.created_at)
+        .order_by(Topic.created_at, Topic.id).limit(limit).offset(offset)
+    ).all()
+    return JSONResponse([{"id": t.id, "name": t.name, "created_at": t.created_at} for t in topics])
 
 
 @app.post("/api/topics")
-def create_topic(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_topic(data: TopicCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create new topic (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    topic = Topic(name=data["name"])
-    db.add(topic)
+    topic = insert_unique(db, Topic, ["name"], name=data.name)
+    if topic is None:
+        raise HTTPException(status_code=400, detail="Topic already exists")
     db.commit()
-    db.refresh(topic)
     
-    return {"id": str(topic.id), "name": topic.name, "created_at": topic.created_at.isoformat()}
+    return {"id": topic.id, "name": topic.name, "created_at": topic.created_at}
 
 
 #================================================================
@@ -207,33 +404,37 @@ def create_topic(data: dict, authorization: str = Header(None), db: Session = De
 #================================================================
 
 @app.get("/api/programs")
-def list_programs(
+async def list_programs(
     status: Optional[str] = None,
     language: Optional[str] = None,
-    authorization: str = Header(None),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all programs with optional filters"""
-    user = get_current_user(authorization, db)
-    
-    query = db.query(Program)
+    """List all programs with optional filters (paginated with limit/offset)"""
+    query = select(Program).options(selectinload(Program.assets), selectinload(Program.topics))
     
     # Apply filters
     if status:
-        query = query.filter(Program.status == status)
+        query = query.where(Program.status == status)
     if language:
-        query = query.filter(Program.language_primary == language)
+        query = query.where(Program.language_primary == language)
     
-    programs = query.all()
-    return [format_program(p) for p in programs]
+    result = await db.execute(query.order_by(Program.created_at, Program.id).limit(limit).offset(offset))
+    programs = result.scalars().all()
+    return JSONResponse([format_program(p) for p in programs])
 
 
 @app.get("/api/programs/{program_id}")
-def get_program(program_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
+async def get_program(program_id: UUID, user: CurrentUser = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     """Get single program"""
-    user = get_current_user(authorization, db)
-    
-    program = db.query(Program).filter(Program.id == program_id).first()
+    result = await db.execute(
+        select(Program)
+        .options(joinedload(Program.assets), joinedload(Program.topics))
+        .where(Program.id == program_id)
+    )
+    program = result.unique().scalar_one_or_none()
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
     
@@ -241,81 +442,75 @@ def get_program(program_id: str, authorization: str = Header(None), db: Session
 
 
 @app.post("/api/programs")
-def create_program(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_program(data: ProgramCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create new program (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
     program = Program(
-        title=data["title"],
-        description=data.get("description"),
-        language_primary=data["language_primary"],
-        languages_available=data["languages_available"]
+        title=data.title,
+        description=data.description,
+        language_primary=data.language_primary,
+        languages_available=data.languages_available
     )
     
     # Add topics
-    if "topic_ids" in data:
-        topics = db.query(Topic).filter(Topic.id.in_(data["topic_ids"])).all()
-        program.topics = topics
+    if "topic_ids" in data.model_fields_set:
+        program.topics = load_topics(db, data.topic_ids)
     
     db.add(program)
     db.commit()
-    db.refresh(program)
+    invalidate_catalog()
     
     return format_program(program)
 
 
 @app.patch("/api/programs/{program_id}")
-def update_program(program_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def update_program(program_id: str, body: ProgramUpdate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Update program (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    program = db.query(Program).filter(Program.id == program_id).first()
+    program = db.execute(select(Program).where(Program.id == program_id)).scalar_one_or_none()
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
     
-    # Update fields
+    # Update fields (only the ones sent in the request)
+    data = body.model_dump(exclude_unset=True)
+    view_key = (program.status, program.published_at)
     if "title" in data:
         program.title = data["title"]
     if "description" in data:
         program.description = data["description"]
     if "status" in data:
         program.status = data["status"]
+        if program.status == ProgramStatus.published and program.published_at is None:
+            program.published_at = datetime.now(timezone.utc)
     if "topic_ids" in data:
-        topics = db.query(Topic).filter(Topic.id.in_(data["topic_ids"])).all()
-        program.topics = topics
+        program.topics = load_topics(db, data["topic_ids"])
     
-    program.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(program)
+    # The view only holds status/published_at-dependent rows: title/topic edits don't touch it
+    if (program.status, program.published_at) != view_key:
+        refresh_published_programs(db)
+    invalidate_catalog()
     
     return format_program(program)
 
 
 @app.post("/api/programs/{program_id}/assets")
-def add_program_asset(program_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def add_program_asset(program_id: str, data: AssetCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Add poster to program (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    program = db.query(Program).filter(Program.id == program_id).first()
-    if not program:
+    if not db.scalar(select(exists().where(Program.id == program_id))):
         raise HTTPException(status_code=404, detail="Program not found")
     
     asset = ProgramAsset(
         program_id=program_id,
-        language=data["language"],
-        variant=data["variant"],
+        language=data.language,
+        variant=data.variant,
         asset_type=AssetType.poster,
-        url=data["url"]
+        url=data.url
     )
     
     db.add(asset)
     db.commit()
-    db.refresh(asset)
+    invalidate_catalog()
     
-    return {"id": str(asset.id), "language": asset.language, "variant": asset.variant.value, "url": asset.url}
+    return {"id": asset.id, "language": asset.language, "variant": asset.variant.value, "url": asset.url}
 
 
 #================================================================
@@ -323,43 +518,48 @@ def add_program_asset(program_id: str, data: dict, authorization: str = Header(N
 #================================================================
 
 @app.get("/api/programs/{program_id}/terms")
-def list_terms(program_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
-    """Get all terms for a program"""
-    user = get_current_user(authorization, db)
-    
-    terms = db.query(Term).filter(Term.program_id == program_id).order_by(Term.term_number).all()
+def list_terms(
+    program_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all terms for a program (paginated with limit/offset)"""
+    terms = db.execute(
+        select(Term).where(Term.program_id == program_id)
+        .order_by(Term.term_number).limit(limit).offset(offset)
+    ).scalars().all()
     
-    return [
+    return JSONResponse([
         {
-            "id": str(t.id),
-            "program_id": str(t.program_id),
+            "id": t.id,
+            "program_id": t.program_id,
             "term_number": t.term_number,
             "title": t.title,
-            "created_at": t.created_at.isoformat()
+            "created_at": t.created_at
         }
         for t in terms
-    ]
+    ])
 
 
 @app.post("/api/terms")
-def create_term(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_term(data: TermCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create new term (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    term = Term(
-        program_id=data["program_id"],
-        term_number=data["term_number"],
-        title=data.get("title")
+    term = insert_unique(
+        db, Term, ["program_id", "term_number"],
+        program_id=data.program_id,
+        term_number=data.term_number,
+        title=data.title
     )
+    if term is None:
+        raise HTTPException(status_code=400, detail="Term number already exists")
     
-    db.add(term)
     db.commit()
-    db.refresh(term)
     
     return {
-        "id": str(term.id),
-        "program_id": str(term.program_id),
+        "id": term.id,
+        "program_id": term.program_id,
         "term_number": term.term_number,
         "title": term.title
     }
@@ -370,20 +570,28 @@ def create_term(data: dict, authorization: str = Header(None), db: Session = Dep
 #================================================================
 
 @app.get("/api/terms/{term_id}/lessons")
-def list_lessons(term_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
-    """Get all lessons for a term"""
-    user = get_current_user(authorization, db)
-    
-    lessons = db.query(Lesson).filter(Lesson.term_id == term_id).order_by(Lesson.lesson_number).all()
-    return [format_lesson(l) for l in lessons]
+def list_lessons(
+    term_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    user: CurrentUser = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all lessons for a term (paginated with limit/offset)"""
+    lessons = db.execute(
+        select(Lesson).options(selectinload(Lesson.assets)).where(Lesson.term_id == term_id)
+        .order_by(Lesson.lesson_number).limit(limit).offset(offset)
+    ).scalars().all()
+    return JSONResponse([format_lesson(l) for l in lessons])
 
 
 @app.get("/api/lessons/{lesson_id}")
-def get_lesson(lesson_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
+async def get_lesson(lesson_id: UUID, user: CurrentUser = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     """Get single lesson"""
-    user = get_current_user(authorization, db)
-    
-    lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
+    result = await db.execute(
+        select(Lesson).options(joinedload(Lesson.assets)).where(Lesson.id == lesson_id)
+    )
+    lesson = result.unique().scalar_one_or_none()
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
     
@@ -391,43 +599,27 @@ def get_lesson(lesson_id: str, authorization: str = Header(None), db: Session =
 
 
 @app.post("/api/lessons")
-def create_lesson(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_lesson(data: LessonCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create new lesson (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    lesson = Lesson(
-        term_id=data["term_id"],
-        lesson_number=data["lesson_number"],
-        title=data["title"],
-        content_type=data["content_type"],
-        duration_ms=data.get("duration_ms"),
-        is_paid=data.get("is_paid", False),
-        content_language_primary=data["content_language_primary"],
-        content_languages_available=data["content_languages_available"],
-        content_urls_by_language=data["content_urls_by_language"],
-        subtitle_languages=data.get("subtitle_languages", []),
-        subtitle_urls_by_language=data.get("subtitle_urls_by_language", {})
-    )
+    lesson = insert_unique(db, Lesson, ["term_id", "lesson_number"], **data.model_dump())
+    if lesson is None:
+        raise HTTPException(status_code=400, detail="Lesson number already exists")
     
-    db.add(lesson)
     db.commit()
-    db.refresh(lesson)
+    invalidate_catalog()
     
     return format_lesson(lesson)
 
 
 @app.patch("/api/lessons/{lesson_id}")
-def update_lesson(lesson_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def update_lesson(lesson_id: str, body: LessonUpdate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Update lesson (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
+    lesson = db.execute(select(Lesson).where(Lesson.id == lesson_id)).scalar_one_or_none()
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
     
-    # Update fields
+    # Update fields (only the ones sent in the request)
+    data = body.model_dump(exclude_unset=True)
     allowed_fields = [
         "title", "content_type", "duration_ms", "is_paid", 
         "content_language_primary", "content_languages_available", 
@@ -438,15 +630,14 @@ def update_lesson(lesson_id: str, data: dict, authorization: str = Header(None),
         if field in data:
             setattr(lesson, field, data[field])
     
-    lesson.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(lesson)
+    invalidate_catalog()
     
     return format_lesson(lesson)
 
 
 @app.post("/api/lessons/{lesson_id}/publish")
-def publish_lesson(lesson_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def publish_lesson(lesson_id: str, data: LessonPublish, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """
     Publish, schedule, or archive a lesson (Admin/Editor only)
     
@@ -455,163 +646,234 @@ def publish_lesson(lesson_id: str, data: dict, authorization: str = Header(None)
     - schedule: Schedule for later (requires publish_at)
     - archive: Archive the lesson
     """
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
     
-    lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
+    lesson = db.execute(select(Lesson).where(Lesson.id == lesson_id)).scalar_one_or_none()
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
     
-    action = data["action"]
+    action = data.action
+    was_published = lesson.status == LessonStatus.published
+    program_published = False
     
     if action == "publish_now":
         # Publish immediately
+        now = datetime.now(timezone.utc)
         lesson.status = LessonStatus.published
-        lesson.published_at = datetime.utcnow()
+        lesson.published_at = now
         lesson.publish_at = None
         
-        # Auto-publish program
-        term = db.query(Term).filter(Term.id == lesson.term_id).first()
-        if term:
-            program = db.query(Program).filter(Program.id == term.program_id).first()
-            if program and program.status == ProgramStatus.draft:
-                program.status = ProgramStatus.published
-                if not program.published_at:
-                    program.published_at = datetime.utcnow()
+        # Auto-publish program (single UPDATE; keeps an existing published_at)
+        program_published = db.execute(
+            update(Program)
+            .where(
+                Program.id == select(Term.program_id).where(Term.id == lesson.term_id).scalar_subquery(),
+                Program.status == ProgramStatus.draft
+            )
+            .values(status=ProgramStatus.published, published_at=func.coalesce(Program.published_at, now))
+            .returning(Program.id)
+            .execution_options(synchronize_session=False)
+        ).first() is not None
     
     elif action == "schedule":
         # Schedule for later
-        if not data.get("publish_at"):
+        if not data.publish_at:
             raise HTTPException(status_code=400, detail="publish_at required for scheduling")
         
         lesson.status = LessonStatus.scheduled
-        lesson.publish_at = datetime.fromisoformat(data["publish_at"].replace('Z', '+00:00'))
+        lesson.publish_at = data.publish_at
+        db.execute(NOTIFY_LESSON_SCHEDULED)  # delivered on commit; wakes the worker
     
     elif action == "archive":
         # Archive lesson
         lesson.status = LessonStatus.archived
     
-    else:
-        raise HTTPException(status_code=400, detail="Invalid action")
-    
     db.commit()
-    db.refresh(lesson)
+    # The view changes only if the program was just published, or if this lesson went in
+    # or out of "published" (it may be its program's first or last published lesson);
+    # rescheduling a lesson that isn't published leaves it alone
+    if program_published or was_published != (lesson.status == LessonStatus.published):
+        refresh_published_programs(db)
+    invalidate_catalog()
     
     return format_lesson(lesson)
 
 
 @app.post("/api/lessons/{lesson_id}/assets")
-def add_lesson_asset(lesson_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def add_lesson_asset(lesson_id: str, data: AssetCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Add thumbnail to lesson (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
-    
-    lesson = db.query(Lesson).filter(Lesson.id == lesson_id).first()
-    if not lesson:
+    if not db.scalar(select(exists().where(Lesson.id == lesson_id))):
         raise HTTPException(status_code=404, detail="Lesson not found")
     
     asset = LessonAsset(
         lesson_id=lesson_id,
-        language=data["language"],
-        variant=data["variant"],
+        language=data.language,
+        variant=data.variant,
         asset_type=AssetType.thumbnail,
-        url=data["url"]
+        url=data.url
     )
     
     db.add(asset)
     db.commit()
-    db.refresh(asset)
+    invalidate_catalog()
     
-    return {"id": str(asset.id), "language": asset.language, "variant": asset.variant.value, "url": asset.url}
+    return {"id": asset.id, "language": asset.language, "variant": asset.variant.value, "url": asset.url}
 
 
 #================================================================
 # 7. PUBLIC CATALOG API (No Auth Required!)
 #================================================================
 
+def encode_catalog_cursor(published_at: datetime, program_id: UUID) -> str:
+    """Build an opaque cursor from the last row's sort key on a catalog page"""
+    raw = f"{published_at.isoformat()}|{program_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_catalog_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a cursor made by encode_catalog_cursor, 400 if it is malformed"""
+    try:
+        published_at, program_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(published_at), UUID(program_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @app.get("/catalog/programs")
-def catalog_list_programs(
+async def catalog_list_programs(
+    request: Request,
     language: Optional[str] = None,
     topic: Optional[str] = None,
     cursor: Optional[str] = None,
-    limit: int = 10,
-    db: Session = Depends(get_db)
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Public API: List published programs
     Only shows programs with at least one published lesson
+    Pages are cached for up to 60 seconds and carry an ETag (304 on If-None-Match)
     """
-    query = db.query(Program).filter(Program.status == ProgramStatus.published)
+    cache_key = (language, topic, cursor, limit)
+    with _catalog_cache_lock:
+        cached = _catalog_cache.get(cache_key)
+    if cached is not None:
+        return catalog_response(request, *cached)
+    
+    # Page through the precomputed view (published programs with published lessons),
+    # then join back to programs for the full rows
+    mv = published_programs_view
+    # The view's own (published_at, id) come back too: the cursor must be built from the
+    # same columns the page is sorted and filtered on, even if programs changed since the refresh
+    query = select(Program, mv.c.published_at, mv.c.id).join(mv, mv.c.id == Program.id).options(
+        selectinload(Program.assets), selectinload(Program.topics)
+    ).where(Program.status == ProgramStatus.published)
     
     # Filters
     if language:
-        query = query.filter(Program.language_primary == language)
+        query = query.where(mv.c.language_primary == language)
     if topic:
-        query = query.join(Program.topics).filter(Topic.name == topic)
-    
-    # Only programs with published lessons
-    query = query.join(Term).join(Lesson).filter(Lesson.status == LessonStatus.published).distinct()
+        query = query.join(Program.topics).where(Topic.name == topic)
     
-    # Sort by most recently published
-    query = query.order_by(Program.published_at.desc())
+    # Sort by most recently published; id breaks ties so pages never skip or repeat rows
+    query = query.order_by(mv.c.published_at.desc(), mv.c.id.desc())
     
-    # Cursor pagination
+    # Cursor pagination (keyset on published_at, id)
     if cursor:
-        cursor_date = datetime.fromisoformat(cursor)
-        query = query.filter(Program.published_at < cursor_date)
+        cursor_date, cursor_id = decode_catalog_cursor(cursor)
+        query = query.where(tuple_(mv.c.published_at, mv.c.id) < tuple_(cursor_date, cursor_id))
     
-    programs = query.limit(limit + 1).all()
+    rows = (await db.execute(query.limit(limit + 1))).all()
     
     # Check if more results
-    has_more = len(programs) > limit
-    programs = programs[:limit]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
     
     next_cursor = None
-    if has_more and programs:
-        next_cursor = programs[-1].published_at.isoformat()
+    if has_more and rows:
+        _, last_published_at, last_id = rows[-1]
+        next_cursor = encode_catalog_cursor(last_published_at, last_id)
     
-    return {
-        "data": [format_program(p) for p in programs],
+    body = json_dumps({
+        "data": [format_program(program) for program, _, _ in rows],
         "next_cursor": next_cursor,
         "has_more": has_more
-    }
+    })
+    etag = make_etag(body)
+    with _catalog_cache_lock:
+        _catalog_cache[cache_key] = (body, etag)
+    return catalog_response(request, body, etag)
+
+
+# Catalog point lookups, built once: lambda_stmt caches the statement by the lambda's
+# code location, so requests skip rebuilding the query and computing its cache key
+_CATALOG_PROGRAM = lambda_stmt(
+    # Load terms -> published lessons -> assets up front (one SELECT per level, not per term)
+    lambda: select(Program).options(
+        selectinload(Program.assets),
+        selectinload(Program.topics),
+        selectinload(Program.terms)
+        .selectinload(Term.lessons.and_(Lesson.status == LessonStatus.published))
+        .selectinload(Lesson.assets),
+    ).where(
+        Program.id == bindparam("program_id"),
+        Program.status == ProgramStatus.published
+    )
+)
+
+_CATALOG_LESSON = lambda_stmt(
+    lambda: select(Lesson).options(selectinload(Lesson.assets)).where(
+        Lesson.id == bindparam("lesson_id"),
+        Lesson.status == LessonStatus.published
+    )
+)
 
 
 @app.get("/catalog/programs/{program_id}")
-def catalog_get_program(program_id: str, db: Session = Depends(get_db)):
-    """Public API: Get program with published lessons only"""
-    program = db.query(Program).filter(
-        Program.id == program_id,
-        Program.status == ProgramStatus.published
-    ).first()
+async def catalog_get_program(program_id: UUID, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Public API: Get program with published lessons only
+    Answers 304 when If-None-Match matches, without building the response
+    """
+    program = (await db.execute(_CATALOG_PROGRAM, {"program_id": program_id})).scalar_one_or_none()
     
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
     
+    # ETag from what the response shows: the program, its published lessons, its topics
+    # (id and name) and every asset (id and url), so swapping a topic or an asset URL
+    # changes it too, without building the response first
+    lessons = [l for term in program.terms for l in term.lessons]
+    version = "|".join(map(str, (
+        program.updated_at.timestamp(),
+        [(l.id, l.updated_at.timestamp()) for l in lessons],
+        sorted((t.id, t.name) for t in program.topics),
+        sorted((a.id, a.url) for a in program.assets),
+        sorted((a.id, a.url) for l in lessons for a in l.assets),
+    )))
+    etag = make_etag(version.encode())
+    if etag_matches(request, etag):
+        return catalog_response(request, b"", etag)
+    
     # Build response with published lessons only
     result = format_program(program)
     result["terms"] = []
     
-    for term in sorted(program.terms, key=lambda t: t.term_number):
-        published_lessons = [l for l in term.lessons if l.status == LessonStatus.published]
-        if published_lessons:
+    # Terms and lessons arrive sorted, and lessons already filtered to published, from SQL
+    for term in program.terms:
+        if term.lessons:
             result["terms"].append({
-                "id": str(term.id),
+                "id": term.id,
                 "term_number": term.term_number,
                 "title": term.title,
-                "lessons": [format_lesson(l) for l in sorted(published_lessons, key=lambda x: x.lesson_number)]
+                "lessons": [format_lesson(l) for l in term.lessons]
             })
     
-    return result
+    return catalog_response(request, json_dumps(result), etag)
 
 
 @app.get("/catalog/lessons/{lesson_id}")
-def catalog_get_lesson(lesson_id: str, db: Session = Depends(get_db)):
+async def catalog_get_lesson(lesson_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Public API: Get published lesson"""
-    lesson = db.query(Lesson).filter(
-        Lesson.id == lesson_id,
-        Lesson.status == LessonStatus.published
-    ).first()
+    lesson = (await db.execute(_CATALOG_LESSON, {"lesson_id": lesson_id})).scalar_one_or_none()
     
     if not lesson:
         raise HTTPException(status_code=404, detail="Lesson not found")
@@ -620,31 +882,34 @@ def catalog_get_lesson(lesson_id: str, db: Session = Depends(get_db)):
 
 
 @app.post("/api/auth/register")
-def register(data: dict, db: Session = Depends(get_db)):
+async def register(data: UserCreate, db: Session = Depends(get_db)):
     """
     Register new user
-    Default role: viewer
+    Default role: viewer (any "role" in the request is ignored)
     """
-    email = data.get("email")
-    password = data.get("password")
-    full_name = data.get("full_name")
+    email = data.email
+    password = data.password
+    full_name = data.full_name
 
-    # Check if user exists
-    existing = db.query(User).filter(User.email == email).first()
-    if existing:
+    # Cheap early check so duplicates don't cost a password hash (insert below is the real guard)
+    if await run_in_threadpool(db.scalar, select(exists().where(User.email == email))):
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    # Hash off the event loop (CPU-bound, ~250ms)
+    hashed = await asyncio.get_running_loop().run_in_executor(_password_pool, hash_password, password)
+
     # Create user
-    user = User(
+    user = await run_in_threadpool(
+        insert_unique, db, User, ["email"],
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=hashed,
         full_name=full_name,
         role=UserRole.viewer  # New users are viewers by default
     )
+    if user is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(db.commit)
 
     # Create token
     token = create_token(user.email)
@@ -653,197 +918,206 @@ def register(data: dict, db: Session = Depends(get_db)):
 
 
 @app.get("/api/users")
-def list_users(authorization: str = Header(None), db: Session = Depends(get_db)):
+def list_users(user: CurrentUser = Depends(require_admin)):
     """
     List all users (Admin only)
+    Streamed as a JSON array, 500 rows at a time, so memory stays flat for big tables
     """
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin])
-
-    users = db.query(User).all()
-    return [
-        {
-            "id": str(u.id),
-            "email": u.email,
-            "full_name": u.full_name,
-            "role": u.role.value,
-            "is_active": u.is_active,
-            "created_at": u.created_at.isoformat()
-        }
-        for u in users
-    ]
+    return StreamingResponse(stream_users(), media_type="application/json")
+
+
+def stream_users():
+    """Yield the users JSON array in chunks from a server-side cursor"""
+    # Own session: get_db's session is closed before a streaming body is sent
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(User.id, User.email, User.full_name, User.role, User.is_active, User.created_at)
+            .execution_options(yield_per=500)
+        )
+        yield b"["
+        separator = b""
+        for chunk in rows.partitions():
+            yield separator + b",".join(
+                orjson.dumps({
+                    "id": u.id,
+                    "email": u.email,
+                    "full_name": u.full_name,
+                    "role": u.role.value,
+                    "is_active": u.is_active,
+                    "created_at": u.created_at
+                })
+                for u in chunk
+            )
+            separator = b","
+        yield b"]"
 
 
 # ======== 8. TOPICS MANAGEMENT ========
 
 @app.post("/api/users")
-def create_user(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+async def create_user(data: UserCreate, current_user: CurrentUser = Depends(require_admin), db: Session = Depends(get_db)):
     """Create new user (Admin only)"""
-    current_user = get_current_user(authorization, db)
-    require_role(current_user, [UserRole.admin])
 
-    email = data.get("email")
-    password = data.get("password")
-    full_name = data.get("full_name")
-    role = data.get("role", UserRole.viewer)
+    email = data.email
+    password = data.password
+    full_name = data.full_name
+    role = data.role
 
-    # Check if user exists
-    existing = db.query(User).filter(User.email == email).first()
-    if existing:
+    # Cheap early check so duplicates don't cost a password hash (insert below is the real guard)
+    if await run_in_threadpool(db.scalar, select(exists().where(User.email == email))):
         raise HTTPException(status_code=400, detail="Email already registered")
 
+    # Hash off the event loop (CPU-bound, ~250ms)
+    hashed = await asyncio.get_running_loop().run_in_executor(_password_pool, hash_password, password)
+
     # Create user
-    user = User(
+    user = await run_in_threadpool(
+        insert_unique, db, User, ["email"],
         email=email,
-        hashed_password=hash_password(password),
+        hashed_password=hashed,
         full_name=full_name,
         role=role
     )
+    if user is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await run_in_threadpool(db.commit)
 
     return {
-        "id": str(user.id),
+        "id": user.id,
         "email": user.email,
         "full_name": user.full_name,
         "role": user.role.value,
         "is_active": user.is_active,
-        "created_at": user.created_at.isoformat()
+        "created_at": user.created_at
     }
 
 
 @app.delete("/api/users/{user_id}")
-def delete_user(user_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
+def delete_user(user_id: str, current_user: CurrentUser = Depends(require_admin), db: Session = Depends(get_db)):
     """Delete user (Admin only)"""
-    current_user = get_current_user(authorization, db)
-    require_role(current_user, [UserRole.admin])
-    
     # Prevent deleting yourself
     if str(current_user.id) == user_id:
         raise HTTPException(status_code=400, detail="Cannot delete your own account")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.execute(select(User).where(User.id == user_id)).scalar_one_or_none()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     db.delete(user)
     db.commit()
+    invalidate_user(user.email)
 
     return {"message": "User deleted successfully"}
 
 @app.get("/api/topics")
-def list_topics(db: Session = Depends(get_db)):
-    """Get all topics"""
-    topics = db.query(Topic).all()
-    return [{"id": str(t.id), "name": t.name, "created_at": t.created_at.isoformat()} for t in topics]
+def list_topics(
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Get all topics (paginated with limit/offset)"""
+    topics = db.execute(
+        select(Topic.id, Topic.name, Topic.created_at)
+        .order_by(Topic.created_at, Topic.id).limit(limit).offset(offset)
+    ).all()
+    return JSONResponse([{"id": t.id, "name": t.name, "created_at": t.created_at} for t in topics])
 
 
 @app.post("/api/topics")
-def create_topic(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_topic(data: TopicCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create new topic (Admin/Editor only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
 
-    name = data.get("name")
+    name = data.name
     if not name:
         raise HTTPException(status_code=400, detail="Topic name is required")
 
-    existing = db.query(Topic).filter(Topic.name == name).first()
-    if existing:
+    topic = insert_unique(db, Topic, ["name"], name=name)
+    if topic is None:
         raise HTTPException(status_code=400, detail="Topic already exists")
-
-    topic = Topic(name=name)
-    db.add(topic)
     db.commit()
-    db.refresh(topic)
 
-    return {"id": str(topic.id), "name": topic.name, "created_at": topic.created_at.isoformat()}
+    return {"id": topic.id, "name": topic.name, "created_at": topic.created_at}
 
 
 @app.put("/api/topics/{topic_id}")
-def update_topic(topic_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def update_topic(topic_id: str, body: TopicUpdate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Update topic"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
+    data = body.model_dump(exclude_unset=True)
 
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
+    topic = db.execute(select(Topic).where(Topic.id == topic_id)).scalar_one_or_none()
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
 
     if "name" in data:
-        existing = db.query(Topic).filter(Topic.name == data["name"], Topic.id != topic_id).first()
-        if existing:
+        if db.scalar(select(exists().where(Topic.name == data["name"], Topic.id != topic_id))):
             raise HTTPException(status_code=400, detail="Topic name already exists")
         topic.name = data["name"]
 
     db.commit()
-    return {"id": str(topic.id), "name": topic.name}
+    invalidate_catalog()
+    return {"id": topic.id, "name": topic.name}
 
 
 @app.delete("/api/topics/{topic_id}")
-def delete_topic(topic_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
+def delete_topic(topic_id: str, user: CurrentUser = Depends(require_admin), db: Session = Depends(get_db)):
     """Delete topic (Admin only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin])
 
-    topic = db.query(Topic).filter(Topic.id == topic_id).first()
+    topic = db.execute(select(Topic).where(Topic.id == topic_id)).scalar_one_or_none()
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
 
     db.delete(topic)
     db.commit()
+    invalidate_catalog()
     return {"message": "Topic deleted"}
 
 
 # ======== 9. PROGRAM MANAGEMENT ========
 
 @app.post("/api/programs")
-def create_program(data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_program(data: ProgramCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create program"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
 
-    title = data.get("title")
+    title = data.title
     if not title:
         raise HTTPException(status_code=400, detail="Title is required")
 
-    language_primary = data.get("language_primary", "en")
-    languages_available = data.get("languages_available", [language_primary])
+    language_primary = data.language_primary
+    languages_available = data.languages_available
 
     if language_primary not in languages_available:
         languages_available.append(language_primary)
 
     program = Program(
         title=title,
-        description=data.get("description", ""),
+        description=data.description or "",
         language_primary=language_primary,
         languages_available=languages_available,
         status=ProgramStatus.draft
     )
 
-    if "topic_ids" in data:
-        topics = db.query(Topic).filter(Topic.id.in_(data["topic_ids"])).all()
-        program.topics = topics
+    if "topic_ids" in data.model_fields_set:
+        program.topics = load_topics(db, data.topic_ids)
 
     db.add(program)
     db.commit()
-    db.refresh(program)
+    invalidate_catalog()
 
     return format_program(program)
 
 
 @app.put("/api/programs/{program_id}")
-def update_program(program_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def update_program(program_id: str, body: ProgramUpdate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Update program"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
 
-    program = db.query(Program).filter(Program.id == program_id).first()
+    program = db.execute(select(Program).where(Program.id == program_id)).scalar_one_or_none()
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
 
+    data = body.model_dump(exclude_unset=True)
+    old_language = program.language_primary
+
     if "title" in data:
         program.title = data["title"]
     if "description" in data:
@@ -853,110 +1127,100 @@ def update_program(program_id: str, data: dict, authorization: str = Header(None
     if "languages_available" in data:
         program.languages_available = data["languages_available"]
     if "topic_ids" in data:
-        topics = db.query(Topic).filter(Topic.id.in_(data["topic_ids"])).all()
-        program.topics = topics
+        program.topics = load_topics(db, data["topic_ids"])
 
-    program.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(program)
+    # Of these fields the view only stores language_primary
+    if program.language_primary != old_language:
+        refresh_published_programs(db)
+    invalidate_catalog()
 
     return format_program(program)
 
 
 @app.delete("/api/programs/{program_id}")
-def delete_program(program_id: str, authorization: str = Header(None), db: Session = Depends(get_db)):
+def delete_program(program_id: str, user: CurrentUser = Depends(require_admin), db: Session = Depends(get_db)):
     """Delete program (Admin only)"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin])
 
-    program = db.query(Program).filter(Program.id == program_id).first()
+    program = db.execute(select(Program).where(Program.id == program_id)).scalar_one_or_none()
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
 
     db.delete(program)
     db.commit()
+    refresh_published_programs(db)
+    invalidate_catalog()
     return {"message": "Program deleted"}
 
 
 # ======== 10. TERM MANAGEMENT ========
 
 @app.post("/api/programs/{program_id}/terms")
-def create_term(program_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_term(program_id: str, data: ProgramTermCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create term"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
 
-    program = db.query(Program).filter(Program.id == program_id).first()
-    if not program:
+    if not db.scalar(select(exists().where(Program.id == program_id))):
         raise HTTPException(status_code=404, detail="Program not found")
 
-    term_number = data.get("term_number")
+    term_number = data.term_number
     if not term_number:
         raise HTTPException(status_code=400, detail="Term number required")
 
-    existing = db.query(Term).filter(Term.program_id == program_id, Term.term_number == term_number).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Term number already exists")
-
-    term = Term(
+    term = insert_unique(
+        db, Term, ["program_id", "term_number"],
         program_id=program_id,
         term_number=term_number,
-        title=data.get("title", "")
+        title=data.title
     )
+    if term is None:
+        raise HTTPException(status_code=400, detail="Term number already exists")
 
-    db.add(term)
     db.commit()
-    db.refresh(term)
 
-    return {"id": str(term.id), "term_number": term.term_number, "title": term.title}
+    return {"id": term.id, "term_number": term.term_number, "title": term.title}
 
 
 # ======== 11. LESSON MANAGEMENT ========
 
 @app.post("/api/terms/{term_id}/lessons")
-def create_lesson(term_id: str, data: dict, authorization: str = Header(None), db: Session = Depends(get_db)):
+def create_lesson(term_id: str, data: TermLessonCreate, user: CurrentUser = Depends(require_editor), db: Session = Depends(get_db)):
     """Create lesson"""
-    user = get_current_user(authorization, db)
-    require_role(user, [UserRole.admin, UserRole.editor])
 
-    term = db.query(Term).filter(Term.id == term_id).first()
-    if not term:
+    if not db.scalar(select(exists().where(Term.id == term_id))):
         raise HTTPException(status_code=404, detail="Term not found")
 
-    lesson_number = data.get("lesson_number")
-    title = data.get("title")
+    lesson_number = data.lesson_number
+    title = data.title
 
     if not lesson_number or not title:
         raise HTTPException(status_code=400, detail="Lesson number and title required")
 
-    existing = db.query(Lesson).filter(Lesson.term_id == term_id, Lesson.lesson_number == lesson_number).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="Lesson number already exists")
-
-    content_language_primary = data.get("content_language_primary", "en")
-    content_languages_available = data.get("content_languages_available", [content_language_primary])
+    content_language_primary = data.content_language_primary
+    content_languages_available = data.content_languages_available or [content_language_primary]
 
     if content_language_primary not in content_languages_available:
         content_languages_available.append(content_language_primary)
 
-    lesson = Lesson(
+    lesson = insert_unique(
+        db, Lesson, ["term_id", "lesson_number"],
         term_id=term_id,
         lesson_number=lesson_number,
         title=title,
-        content_type=ContentType[data.get("content_type", "video")],
-        duration_ms=data.get("duration_ms"),
-        is_paid=data.get("is_paid", False),
+        content_type=data.content_type,
+        duration_ms=data.duration_ms,
+        is_paid=data.is_paid,
         content_language_primary=content_language_primary,
         content_languages_available=content_languages_available,
-        content_urls_by_language=data.get("content_urls_by_language", {}),
-        subtitle_languages=data.get("subtitle_languages", []),
-        subtitle_urls_by_language=data.get("subtitle_urls_by_language", {}),
+        content_urls_by_language=data.content_urls_by_language,
+        subtitle_languages=data.subtitle_languages,
+        subtitle_urls_by_language=data.subtitle_urls_by_language,
         status=LessonStatus.draft
     )
+    if lesson is None:
+        raise HTTPException(status_code=400, detail="Lesson number already exists")
 
-    db.add(lesson)
     db.commit()
-    db.refresh(lesson)
+    invalidate_catalog()
 
     return format_lesson(lesson)
 
@@ -964,40 +1228,54 @@ def create_lesson(term_id: str, data: dict, authorization: str = Header(None), d
 # ======== 12. DASHBOARD STATS ========
 
 @app.get("/api/dashboard/stats")
-def get_dashboard_stats(authorization: str = Header(None), db: Session = Depends(get_db)):
+def get_dashboard_stats(user: CurrentUser = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get dashboard statistics"""
-    user = get_current_user(authorization, db)
-
-    total_programs = db.query(Program).count()
-    total_lessons = db.query(Lesson).count()
-    total_users = db.query(User).count()
-    published_programs = db.query(Program).filter(Program.status == ProgramStatus.published).count()
-    published_lessons = db.query(Lesson).filter(Lesson.status == LessonStatus.published).count()
 
-    # Recent activity
-    recent_lessons = db.query(Lesson).filter(
-        Lesson.status.in_([LessonStatus.published, LessonStatus.scheduled])
-    ).order_by(Lesson.updated_at.desc()).limit(5).all()
+    # All counts in one round trip: one aggregate scan per table, FILTER for the published subsets
+    program_counts = select(
+        func.count().label("total"),
+        func.count().filter(Program.status == ProgramStatus.published).label("published"),
+    ).select_from(Program).subquery()
+    lesson_counts = select(
+        func.count().label("total"),
+        func.count().filter(Lesson.status == LessonStatus.published).label("published"),
+    ).select_from(Lesson).subquery()
+    user_count = select(func.count()).select_from(User).scalar_subquery()
+
+    total_programs, published_programs, total_lessons, published_lessons, total_users = db.execute(
+        select(
+            program_counts.c.total, program_counts.c.published,
+            lesson_counts.c.total, lesson_counts.c.published,
+            user_count,
+        ).select_from(program_counts.join(lesson_counts, true()))  # one row each: explicit cross join
+    ).one()
+
+    # Recent activity (only the columns shown, no ORM objects)
+    recent_lessons = db.execute(
+        select(Lesson.id, Lesson.title, Lesson.status, Lesson.updated_at, Lesson.publish_at, Lesson.published_at)
+        .where(Lesson.status.in_([LessonStatus.published, LessonStatus.scheduled]))
+        .order_by(Lesson.updated_at.desc()).limit(5)
+    ).all()
 
     activity = []
     for lesson in recent_lessons:
         activity.append({
-            "id": str(lesson.id),
+            "id": lesson.id,
             "title": lesson.title,
             "status": lesson.status.value,
-            "updated_at": lesson.updated_at.isoformat(),
-            "publish_at": lesson.publish_at.isoformat() if lesson.publish_at else None,
-            "published_at": lesson.published_at.isoformat() if lesson.published_at else None
+            "updated_at": lesson.updated_at,
+            "publish_at": lesson.publish_at,
+            "published_at": lesson.published_at
         })
 
-    return {
+    return JSONResponse({
         "total_programs": total_programs,
         "total_lessons": total_lessons,
         "total_users": total_users,
         "published_programs": published_programs,
         "published_lessons": published_lessons,
         "recent_activity": activity
-    }
+    })
 
 
 
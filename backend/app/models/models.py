@@ -1,7 +1,6 @@
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Enum as SQLEnum, ForeignKey, Table, UniqueConstraint, Index, Text, ARRAY, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import text, func, MetaData, Column, String, DateTime, Boolean, Integer, Enum as SQLEnum, ForeignKey, Table, UniqueConstraint, Index, Text, ARRAY, JSON
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import uuid
 import enum
 
@@ -49,31 +48,35 @@ class UserRole(str, enum.Enum):
 program_topics = Table(
     'program_topics',
     Base.metadata,
-    Column('program_id', UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE')),
-    Column('topic_id', UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE')),
+    Column('program_id', PG_UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE')),
+    Column('topic_id', PG_UUID(as_uuid=True), ForeignKey('topics.id', ondelete='CASCADE')),
     UniqueConstraint('program_id', 'topic_id', name='uq_program_topic')
 )
 
 
 # Models
+# Timestamps come from the database (now()); eager_defaults reads them back
+# via INSERT/UPDATE ... RETURNING instead of a follow-up SELECT
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, nullable=False, index=True)
     hashed_password = Column(String, nullable=False)
     full_name = Column(String)
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.viewer)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class Topic(Base):
     __tablename__ = "topics"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, unique=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     programs = relationship("Program", secondary=program_topics, back_populates="topics")
@@ -81,37 +84,48 @@ class Topic(Base):
 
 class Program(Base):
     __tablename__ = "programs"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
     description = Column(Text)
-    language_primary = Column(String, nullable=False)
+    language_primary = Column(String, nullable=False, index=True)
     languages_available = Column(ARRAY(String), nullable=False)
     status = Column(SQLEnum(ProgramStatus), nullable=False, default=ProgramStatus.draft)
-    published_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     topics = relationship("Topic", secondary=program_topics, back_populates="programs")
-    terms = relationship("Term", back_populates="program", cascade="all, delete-orphan")
+    terms = relationship("Term", back_populates="program", cascade="all, delete-orphan", order_by="Term.term_number")
     assets = relationship("ProgramAsset", back_populates="program", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index('ix_program_status_language_published', 'status', 'language_primary', 'published_at'),
+        # Catalog by language: WHERE status, language_primary ORDER BY published_at DESC, id DESC
+        Index(
+            'ix_program_status_language_published_id',
+            'status', 'language_primary', text('published_at DESC'), text('id DESC'),
+        ),
+        # Catalog, all languages (published rows only)
+        Index(
+            'ix_program_pub_id', 'status', text('published_at DESC'), text('id DESC'),
+            postgresql_where=text("status = 'published'"),
+        ),
     )
 
 
 class ProgramAsset(Base):
     __tablename__ = "program_assets"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    program_id = Column(UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE'), nullable=False)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    program_id = Column(PG_UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE'), nullable=False)
     language = Column(String, nullable=False)
     variant = Column(SQLEnum(AssetVariant), nullable=False)
     asset_type = Column(SQLEnum(AssetType), nullable=False)
     url = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     program = relationship("Program", back_populates="assets")
@@ -124,16 +138,17 @@ class ProgramAsset(Base):
 
 class Term(Base):
     __tablename__ = "terms"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    program_id = Column(UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE'), nullable=False)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    program_id = Column(PG_UUID(as_uuid=True), ForeignKey('programs.id', ondelete='CASCADE'), nullable=False)
     term_number = Column(Integer, nullable=False)
     title = Column(String)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     program = relationship("Program", back_populates="terms")
-    lessons = relationship("Lesson", back_populates="term", cascade="all, delete-orphan")
+    lessons = relationship("Lesson", back_populates="term", cascade="all, delete-orphan", order_by="Lesson.lesson_number")
 
     __table_args__ = (
         UniqueConstraint('program_id', 'term_number', name='uq_program_term'),
@@ -142,9 +157,10 @@ class Term(Base):
 
 class Lesson(Base):
     __tablename__ = "lessons"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    term_id = Column(UUID(as_uuid=True), ForeignKey('terms.id', ondelete='CASCADE'), nullable=False)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    term_id = Column(PG_UUID(as_uuid=True), ForeignKey('terms.id', ondelete='CASCADE'), nullable=False)
     lesson_number = Column(Integer, nullable=False)
     title = Column(String, nullable=False)
     content_type = Column(SQLEnum(ContentType), nullable=False)
@@ -162,10 +178,10 @@ class Lesson(Base):
     
     # Publishing workflow
     status = Column(SQLEnum(LessonStatus), nullable=False, default=LessonStatus.draft)
-    publish_at = Column(DateTime, nullable=True)
-    published_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    publish_at = Column(DateTime(timezone=True), nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     term = relationship("Term", back_populates="lessons")
@@ -173,21 +189,28 @@ class Lesson(Base):
 
     __table_args__ = (
         UniqueConstraint('term_id', 'lesson_number', name='uq_term_lesson'),
-        Index('ix_lesson_status_publish', 'status', 'publish_at'),
+        # Worker: WHERE status = 'scheduled' AND publish_at <= now / MIN(publish_at)
+        # Partial, so it only holds the (few) scheduled lessons
+        Index(
+            'ix_lesson_scheduled_publish_at', 'publish_at',
+            postgresql_where=text("status = 'scheduled'"),
+        ),
         Index('ix_lesson_term_number', 'term_id', 'lesson_number'),
+        Index('ix_lesson_term_status', 'term_id', 'status'),
     )
 
 
 class LessonAsset(Base):
     __tablename__ = "lesson_assets"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    lesson_id = Column(UUID(as_uuid=True), ForeignKey('lessons.id', ondelete='CASCADE'), nullable=False)
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    lesson_id = Column(PG_UUID(as_uuid=True), ForeignKey('lessons.id', ondelete='CASCADE'), nullable=False)
     language = Column(String, nullable=False)
     variant = Column(SQLEnum(AssetVariant), nullable=False)
     asset_type = Column(SQLEnum(AssetType), nullable=False)
     url = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     lesson = relationship("Lesson", back_populates="assets")
@@ -196,3 +219,54 @@ class LessonAsset(Base):
         UniqueConstraint('lesson_id', 'language', 'variant', 'asset_type', name='uq_lesson_asset'),
         Index('ix_lesson_asset_lookup', 'lesson_id', 'language', 'variant'),
     )
+
+
+# Materialized view behind GET /catalog/programs: published programs that have at
+# least one published lesson, reduced to the columns the catalog filters and sorts on.
+# Kept off Base.metadata so create_all doesn't make it a table; created by
+# PUBLISHED_PROGRAMS_VIEW_DDL and refreshed after anything that changes publish state
+published_programs_view = Table(
+    'mv_published_programs',
+    MetaData(),
+    Column('id', PG_UUID(as_uuid=True), primary_key=True),
+    Column('language_primary', String),
+    Column('published_at', DateTime(timezone=True)),
+)
+
+PUBLISHED_PROGRAMS_VIEW_DDL = (
+    text("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_published_programs AS
+        SELECT p.id, p.language_primary, p.published_at
+        FROM programs p
+        WHERE p.status = 'published'
+          AND p.published_at IS NOT NULL
+          AND EXISTS (
+              SELECT 1 FROM terms t JOIN lessons l ON l.term_id = t.id
+              WHERE t.program_id = p.id AND l.status = 'published'
+          )
+    """),
+    # Unique index is required for REFRESH ... CONCURRENTLY
+    text("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_published_programs_id ON mv_published_programs (id)"),
+    text("CREATE INDEX IF NOT EXISTS ix_mv_published_programs_pub ON mv_published_programs (published_at DESC, id DESC)"),
+    text("CREATE INDEX IF NOT EXISTS ix_mv_published_programs_lang_pub ON mv_published_programs (language_primary, published_at DESC, id DESC)"),
+)
+
+# Held while creating the schema, so a seed run and the migrating process never race
+# (transaction-scoped, released on commit)
+SCHEMA_LOCK = text("SELECT pg_advisory_xact_lock(hashtext('cms_schema'))")
+
+
+def create_schema(engine):
+    """Create all tables, indexes and the catalog view that don't exist yet (one transaction)"""
+    with engine.begin() as conn:
+        conn.execute(SCHEMA_LOCK)
+        Base.metadata.create_all(bind=conn)
+        for stmt in PUBLISHED_PROGRAMS_VIEW_DDL:
+            conn.execute(stmt)
+
+# Rebuilds the view without blocking catalog reads
+REFRESH_PUBLISHED_PROGRAMS = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_published_programs")
+
+# Sent when a lesson is scheduled so the worker can wake before its next poll
+LESSON_SCHEDULED_CHANNEL = "lesson_scheduled"
+NOTIFY_LESSON_SCHEDULED = text(f"NOTIFY {LESSON_SCHEDULED_CHANNEL}")
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, validator
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 from datetime import datetime
 from uuid import UUID
 from app.models.models import ProgramStatus, LessonStatus, ContentType, AssetVariant, UserRole
@@ -40,6 +40,10 @@ class TopicCreate(BaseModel):
     name: str
 
 
+class TopicUpdate(BaseModel):
+    name: Optional[str] = None
+
+
 class TopicResponse(BaseModel):
     id: UUID
     name: str
@@ -114,6 +118,12 @@ class TermCreate(BaseModel):
     title: Optional[str] = None
 
 
+class ProgramTermCreate(BaseModel):
+    """Term created under /api/programs/{program_id}/terms"""
+    term_number: int
+    title: Optional[str] = ""
+
+
 class TermUpdate(BaseModel):
     term_number: Optional[int] = None
     title: Optional[str] = None
@@ -163,6 +173,20 @@ class LessonCreate(BaseModel):
         return v
 
 
+class TermLessonCreate(BaseModel):
+    """Lesson created under /api/terms/{term_id}/lessons (lenient defaults for the admin UI)"""
+    lesson_number: int
+    title: str
+    content_type: ContentType = ContentType.video
+    duration_ms: Optional[int] = None
+    is_paid: bool = False
+    content_language_primary: str = "en"
+    content_languages_available: Optional[List[str]] = None
+    content_urls_by_language: Dict[str, str] = {}
+    subtitle_languages: List[str] = []
+    subtitle_urls_by_language: Dict[str, str] = {}
+
+
 class LessonUpdate(BaseModel):
     lesson_number: Optional[int] = None
     title: Optional[str] = None
@@ -177,7 +201,7 @@ class LessonUpdate(BaseModel):
 
 
 class LessonPublish(BaseModel):
-    action: str  # "publish_now", "schedule", "archive"
+    action: Literal["publish_now", "schedule", "archive"]
     publish_at: Optional[datetime] = None
 
 
@@ -0,0 +1,7 @@
+-- Index for GET /api/programs?language=... (filters on language_primary alone).
+-- Status filters are already served by ix_program_status_language_published,
+-- terms/lessons by their (program_id, term_number) / (term_id, lesson_number)
+-- unique constraints, and users by the unique index on email.
+-- Run outside a transaction: psql "$DATABASE_URL" -f migrations/001_program_language_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_programs_language_primary ON programs (language_primary);
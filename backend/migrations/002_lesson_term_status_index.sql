@@ -0,0 +1,5 @@
+-- Index for the catalog "has at least one published lesson" EXISTS probe
+-- (lessons.term_id = terms.id AND lessons.status = 'published').
+-- Run outside a transaction: psql "$DATABASE_URL" -f migrations/002_lesson_term_status_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lesson_term_status ON lessons (term_id, status);
@@ -0,0 +1,7 @@
+-- Index for the catalog keyset: ORDER BY published_at DESC, id DESC
+-- with WHERE (published_at, id) < (cursor) over published programs only.
+-- Run outside a transaction: psql "$DATABASE_URL" -f migrations/003_program_pub_id_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_program_pub_id
+    ON programs (status, published_at DESC, id DESC)
+    WHERE status = 'published';
@@ -0,0 +1,9 @@
+-- Catalog filtered by language: WHERE status = 'published' AND language_primary = ?
+-- ORDER BY published_at DESC, id DESC is answered by one index range scan, no Sort node.
+-- Replaces ix_program_status_language_published (same leading columns).
+-- Run outside a transaction: psql "$DATABASE_URL" -f migrations/004_program_status_language_published_id_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_program_status_language_published_id
+    ON programs (status, language_primary, published_at DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_program_status_language_published;
@@ -0,0 +1,43 @@
+-- Store every timestamp as TIMESTAMPTZ and let Postgres fill created_at / updated_at.
+-- Existing values were written as naive UTC, so convert them AT TIME ZONE 'UTC'.
+-- ALTER ... TYPE rewrites each table under an ACCESS EXCLUSIVE lock: run in a quiet window.
+-- psql "$DATABASE_URL" -f migrations/005_timestamptz_server_defaults.sql
+
+BEGIN;
+
+ALTER TABLE users
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE topics
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE programs
+    ALTER COLUMN published_at TYPE timestamptz USING published_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at SET DEFAULT now();
+
+ALTER TABLE program_assets
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE terms
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+ALTER TABLE lessons
+    ALTER COLUMN publish_at TYPE timestamptz USING publish_at AT TIME ZONE 'UTC',
+    ALTER COLUMN published_at TYPE timestamptz USING published_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN updated_at TYPE timestamptz USING updated_at AT TIME ZONE 'UTC',
+    ALTER COLUMN updated_at SET DEFAULT now();
+
+ALTER TABLE lesson_assets
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+
+COMMIT;
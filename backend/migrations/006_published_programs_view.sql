@@ -0,0 +1,19 @@
+-- Materialized view behind GET /catalog/programs: published programs with at least
+-- one published lesson, keyed and sorted the way the catalog pages through them.
+-- The API refreshes it (CONCURRENTLY) after publish-state changes; the worker after each run.
+-- psql "$DATABASE_URL" -f migrations/006_published_programs_view.sql
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_published_programs AS
+SELECT p.id, p.language_primary, p.published_at
+FROM programs p
+WHERE p.status = 'published'
+  AND p.published_at IS NOT NULL
+  AND EXISTS (
+      SELECT 1 FROM terms t JOIN lessons l ON l.term_id = t.id
+      WHERE t.program_id = p.id AND l.status = 'published'
+  );
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_published_programs_id ON mv_published_programs (id);
+CREATE INDEX IF NOT EXISTS ix_mv_published_programs_pub ON mv_published_programs (published_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ix_mv_published_programs_lang_pub ON mv_published_programs (language_primary, published_at DESC, id DESC);
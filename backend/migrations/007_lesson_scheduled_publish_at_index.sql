@@ -0,0 +1,11 @@
+-- Partial index for the publishing worker:
+-- WHERE status = 'scheduled' AND publish_at <= now, and MIN(publish_at) over scheduled lessons.
+-- Only scheduled rows are indexed, so it stays small and cheap to maintain; it
+-- replaces the full (status, publish_at) index, which nothing else used.
+-- Run outside a transaction: psql "$DATABASE_URL" -f migrations/007_lesson_scheduled_publish_at_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_lesson_scheduled_publish_at
+    ON lessons (publish_at)
+    WHERE status = 'scheduled';
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_lesson_status_publish;
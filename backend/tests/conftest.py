@@ -0,0 +1,145 @@
+"""
+Shared test fixtures
+No database needed: the async session is replaced by FakeAsyncSession, which
+hands back prepared ORM objects. Ids are asyncpg's own UUID type, exactly what
+the asyncpg driver returns, so responses are serialized like in production.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from asyncpg.pgproto.pgproto import UUID as AsyncpgUUID
+from fastapi.testclient import TestClient
+
+from sqlalchemy.sql.elements import TextClause
+
+from app.db.database import get_async_db, get_db
+from app.main import app, get_current_user, CurrentUser, invalidate_catalog
+from app.models.models import (
+    Program, ProgramStatus, Topic, Term, Lesson, LessonStatus, ContentType, UserRole
+)
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def asyncpg_uuid() -> AsyncpgUUID:
+    return AsyncpgUUID(str(uuid4()))
+
+
+def make_program(**values) -> Program:
+    program = Program(**{
+        "id": asyncpg_uuid(), "title": "Foundation Mathematics", "description": None,
+        "language_primary": "te", "languages_available": ["te"], "status": ProgramStatus.published,
+        "published_at": NOW, "created_at": NOW, "updated_at": NOW, **values,
+    })
+    program.assets = []
+    program.topics = [Topic(id=asyncpg_uuid(), name="Mathematics", created_at=NOW)]
+    return program
+
+
+def make_lesson(**values) -> Lesson:
+    lesson = Lesson(**{
+        "id": asyncpg_uuid(), "term_id": asyncpg_uuid(), "lesson_number": 1, "title": "Introduction to Numbers",
+        "content_type": ContentType.video, "duration_ms": 300000, "is_paid": False,
+        "content_language_primary": "te", "content_languages_available": ["te"],
+        "content_urls_by_language": {"te": "https://example.com/video1.mp4"},
+        "subtitle_languages": [], "subtitle_urls_by_language": {},
+        "status": LessonStatus.published, "published_at": NOW, "created_at": NOW, "updated_at": NOW, **values,
+    })
+    lesson.assets = []
+    return lesson
+
+
+def make_term(program: Program, lessons: list) -> Term:
+    term = Term(id=asyncpg_uuid(), program_id=program.id, term_number=1, title="Basic Algebra", created_at=NOW)
+    term.lessons = lessons
+    program.terms = [term]
+    return term
+
+
+class FakeResult:
+    """The slice of SQLAlchemy's Result API the endpoints use"""
+    def __init__(self, rows):
+        self._rows = rows
+
+    def unique(self):
+        return self
+
+    def scalars(self):
+        return FakeResult([row[0] if isinstance(row, tuple) else row for row in self._rows])
+
+    def all(self):
+        return list(self._rows)
+
+    def one(self):
+        (row,) = self._rows
+        return row
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def scalar_one_or_none(self):
+        rows = self.scalars().all()
+        return rows[0] if rows else None
+
+
+class FakeAsyncSession:
+    """Returns the queued results in order, one per execute()"""
+    def __init__(self):
+        self.results = []
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return FakeResult(self.results.pop(0))
+
+
+class FakeSession:
+    """
+    Sync counterpart for the threadpool endpoints: queued results are used for
+    ORM statements; raw SQL (REFRESH, NOTIFY) is only recorded
+    """
+    def __init__(self):
+        self.results = []
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(statement)
+        if isinstance(statement, TextClause):
+            return FakeResult([])
+        return FakeResult(self.results.pop(0))
+
+    def add(self, obj):
+        pass
+
+    def commit(self):
+        pass
+
+    def executed(self, text_statement) -> bool:
+        return any(s is text_statement for s in self.statements)
+
+
+@pytest.fixture
+def db():
+    return FakeAsyncSession()
+
+
+@pytest.fixture
+def sync_db():
+    return FakeSession()
+
+
+@pytest.fixture
+def client(db, sync_db):
+    async def override_db():
+        yield db
+
+    async def override_user():
+        return CurrentUser(asyncpg_uuid(), "admin@example.com", UserRole.admin, True, "Admin User", NOW)
+
+    app.dependency_overrides[get_async_db] = override_db
+    app.dependency_overrides[get_db] = lambda: sync_db
+    app.dependency_overrides[get_current_user] = override_user
+    invalidate_catalog()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
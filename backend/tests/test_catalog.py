@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from app.main import decode_catalog_cursor
+from app.models.models import AssetType, AssetVariant, LessonAsset, ProgramAsset, Topic
+from conftest import NOW, asyncpg_uuid, make_lesson, make_program, make_term
+
+
+def view_rows(programs):
+    """Rows as the catalog query returns them: (Program, mv.published_at, mv.id)"""
+    return [(p, p.published_at, p.id) for p in programs]
+
+
+def test_catalog_list_programs(client, db):
+    programs = [make_program(), make_program(title="Science Fundamentals")]
+    db.results.append(view_rows(programs))
+
+    response = client.get("/catalog/programs")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [p["id"] for p in body["data"]] == [str(p.id) for p in programs]
+    assert body["has_more"] is False
+    assert "etag" in response.headers
+
+
+def test_catalog_list_programs_is_cached_with_etag(client, db):
+    db.results.append(view_rows([make_program()]))
+
+    first = client.get("/catalog/programs")
+    # Served from the page cache: no second query is queued, so a DB hit would fail
+    again = client.get("/catalog/programs", headers={"If-None-Match": first.headers["etag"]})
+
+    assert again.status_code == 304
+    assert len(db.statements) == 1
+
+
+def test_catalog_cursor_uses_view_sort_key(client, db):
+    # Republished since the last view refresh: programs.published_at no longer matches the view
+    programs = [make_program(), make_program(title="Science Fundamentals")]
+    view_published_at = NOW - timedelta(days=1)
+    programs[0].published_at = NOW + timedelta(hours=1)
+    db.results.append([(programs[0], view_published_at, programs[0].id), (programs[1], NOW, programs[1].id)])
+
+    body = client.get("/catalog/programs?limit=1").json()
+
+    assert body["has_more"] is True
+    assert decode_catalog_cursor(body["next_cursor"]) == (view_published_at, programs[0].id)
+
+
+def test_catalog_get_program(client, db):
+    program = make_program()
+    lesson = make_lesson()
+    term = make_term(program, [lesson])
+    db.results.append([program])
+
+    response = client.get(f"/catalog/programs/{program.id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == str(program.id)
+    assert body["terms"][0]["id"] == str(term.id)
+    assert body["terms"][0]["lessons"][0]["id"] == str(lesson.id)
+
+    db.results.append([program])
+    again = client.get(f"/catalog/programs/{program.id}", headers={"If-None-Match": response.headers["etag"]})
+    assert again.status_code == 304
+
+
+def _program_with_assets():
+    program = make_program()
+    program.assets = [ProgramAsset(id=asyncpg_uuid(), language="te", variant=AssetVariant.portrait,
+                                   asset_type=AssetType.poster, url="https://example.com/p1.jpg")]
+    lesson = make_lesson()
+    lesson.assets = [LessonAsset(id=asyncpg_uuid(), language="te", variant=AssetVariant.portrait,
+                                 asset_type=AssetType.thumbnail, url="https://example.com/l1.jpg")]
+    make_term(program, [lesson])
+    return program, lesson
+
+
+def _etag(client, db, program):
+    db.results.append([program])
+    return client.get(f"/catalog/programs/{program.id}").headers["etag"]
+
+
+def test_catalog_program_etag_changes_with_topic_name(client, db):
+    program, _ = _program_with_assets()
+    before = _etag(client, db, program)
+
+    program.topics[0].name = "Maths"
+
+    assert _etag(client, db, program) != before
+
+
+def test_catalog_program_etag_changes_when_topic_is_replaced(client, db):
+    program, _ = _program_with_assets()
+    before = _etag(client, db, program)
+
+    program.topics = [Topic(id=asyncpg_uuid(), name="Science", created_at=NOW)]
+
+    assert _etag(client, db, program) != before
+
+
+def test_catalog_program_etag_changes_with_asset_urls(client, db):
+    program, lesson = _program_with_assets()
+    before = _etag(client, db, program)
+
+    program.assets[0].url = "https://example.com/p2.jpg"
+    after_program_asset = _etag(client, db, program)
+    lesson.assets[0].url = "https://example.com/l2.jpg"
+    after_lesson_asset = _etag(client, db, program)
+
+    assert len({before, after_program_asset, after_lesson_asset}) == 3
+
+
+def test_catalog_list_programs_limit_is_bounded(client, db):
+    assert client.get("/catalog/programs?limit=0").status_code == 422
+    assert client.get("/catalog/programs?limit=-1").status_code == 422
+    assert client.get("/catalog/programs?limit=100000").status_code == 422
+    assert db.statements == []
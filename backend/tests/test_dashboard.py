@@ -0,0 +1,37 @@
+import warnings
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.compiler import FROM_LINTING
+
+from app.db.database import get_db
+from app.main import app
+from app.models.models import LessonStatus
+from conftest import FakeResult, NOW, asyncpg_uuid
+
+
+class LintingSession:
+    """Sync session stand-in that compiles each statement with SQLAlchemy's FROM linter"""
+    def __init__(self, results):
+        self.results = results
+
+    def execute(self, statement, params=None):
+        statement.compile(dialect=postgresql.dialect(), linting=FROM_LINTING)
+        return FakeResult(self.results.pop(0))
+
+
+def test_dashboard_stats_without_cartesian_product_warning(client):
+    recent = SimpleNamespace(
+        id=asyncpg_uuid(), title="Introduction to Numbers", status=LessonStatus.published,
+        updated_at=NOW, publish_at=None, published_at=NOW,
+    )
+    app.dependency_overrides[get_db] = lambda: LintingSession([[(2, 1, 6, 4, 3)], [recent]])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        response = client.get("/api/dashboard/stats")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["total_programs"], body["published_lessons"], body["total_users"]) == (2, 4, 3)
+    assert body["recent_activity"][0]["id"] == str(recent.id)
@@ -0,0 +1,45 @@
+from uuid import uuid4
+
+from conftest import make_lesson, make_program
+
+
+def test_get_program_by_id(client, db):
+    program = make_program()
+    db.results.append([program])
+
+    response = client.get(f"/api/programs/{program.id}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(program.id)
+
+
+def test_get_program_rejects_malformed_id(client):
+    assert client.get("/api/programs/not-a-uuid").status_code == 422
+
+
+def test_get_program_not_found(client, db):
+    db.results.append([])
+
+    assert client.get(f"/api/programs/{uuid4()}").status_code == 404
+
+
+def test_list_programs_async_path(client, db):
+    programs = [make_program(), make_program(title="Science Fundamentals")]
+    db.results.append(programs)
+
+    response = client.get("/api/programs")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [p["id"] for p in body] == [str(p.id) for p in programs]
+    assert body[0]["topics"][0]["id"] == str(programs[0].topics[0].id)
+
+
+def test_get_lesson_by_id(client, db):
+    lesson = make_lesson()
+    db.results.append([lesson])
+
+    response = client.get(f"/api/lessons/{lesson.id}")
+
+    assert response.status_code == 200
+    assert response.json()["term_id"] == str(lesson.term_id)
@@ -0,0 +1,75 @@
+"""mv_published_programs is only refreshed by edits that can change its rows"""
+from app.models.models import REFRESH_PUBLISHED_PROGRAMS, LessonStatus, ProgramStatus
+from conftest import NOW, make_lesson, make_program
+
+
+def test_title_edit_does_not_refresh_view(client, sync_db):
+    program = make_program()
+    sync_db.results.append([program])
+
+    response = client.patch(f"/api/programs/{program.id}", json={"title": "Algebra I"})
+
+    assert response.status_code == 200
+    assert not sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_status_change_refreshes_view(client, sync_db):
+    program = make_program(status=ProgramStatus.draft, published_at=None)
+    sync_db.results.append([program])
+
+    response = client.patch(f"/api/programs/{program.id}", json={"status": "published"})
+
+    assert response.status_code == 200
+    assert sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_put_without_language_change_does_not_refresh_view(client, sync_db):
+    program = make_program()
+    sync_db.results.append([program])
+
+    response = client.put(f"/api/programs/{program.id}", json={"description": "New", "language_primary": "te"})
+
+    assert response.status_code == 200
+
+    assert not sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_put_language_change_refreshes_view(client, sync_db):
+    program = make_program()
+    sync_db.results.append([program])
+
+    response = client.put(f"/api/programs/{program.id}", json={"language_primary": "en", "languages_available": ["en"]})
+
+    assert response.status_code == 200
+
+    assert sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_scheduling_a_draft_lesson_does_not_refresh_view(client, sync_db):
+    lesson = make_lesson(status=LessonStatus.draft, published_at=None)
+    sync_db.results.append([lesson])
+
+    response = client.post(
+        f"/api/lessons/{lesson.id}/publish", json={"action": "schedule", "publish_at": NOW.isoformat()}
+    )
+
+    assert response.status_code == 200
+    assert not sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_publish_now_refreshes_view_when_program_auto_published(client, sync_db):
+    lesson = make_lesson(status=LessonStatus.draft, published_at=None)
+    sync_db.results += [[lesson], [(lesson.term_id,)]]
+
+    client.post(f"/api/lessons/{lesson.id}/publish", json={"action": "publish_now"})
+
+    assert sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
+
+
+def test_republishing_a_published_lesson_does_not_refresh_view(client, sync_db):
+    lesson = make_lesson()
+    sync_db.results += [[lesson], []]  # program already published: the UPDATE matches nothing
+
+    client.post(f"/api/lessons/{lesson.id}/publish", json={"action": "publish_now"})
+
+    assert not sync_db.executed(REFRESH_PUBLISHED_PROGRAMS)
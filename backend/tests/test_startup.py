@@ -0,0 +1,21 @@
+import app.main as main
+
+
+def test_api_startup_leaves_schema_alone_by_default(monkeypatch):
+    calls = []
+    monkeypatch.delenv("RUN_MIGRATIONS", raising=False)
+    monkeypatch.setattr(main, "create_schema", calls.append)
+
+    main.init_db()
+
+    assert calls == []
+
+
+def test_api_startup_creates_schema_when_asked(monkeypatch):
+    calls = []
+    monkeypatch.setenv("RUN_MIGRATIONS", "1")
+    monkeypatch.setattr(main, "create_schema", calls.append)
+
+    main.init_db()
+
+    assert calls == [main.engine]
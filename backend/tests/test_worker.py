@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import worker
+
+
+@pytest.mark.parametrize("succeeded, status", [(True, 0), (False, 1)])
+def test_oneshot_exit_status(monkeypatch, succeeded, status):
+    monkeypatch.setattr(worker, "publish_scheduled_lessons", lambda db: succeeded)
+
+    with pytest.raises(SystemExit) as exit_info:
+        worker.run_once()
+
+    assert exit_info.value.code == status
+
+
+def test_oneshot_exits_1_when_the_session_fails(monkeypatch):
+    def fail(db):
+        raise RuntimeError("database unavailable")
+    monkeypatch.setattr(worker, "publish_scheduled_lessons", fail)
+
+    with pytest.raises(SystemExit) as exit_info:
+        worker.run_once()
+
+    assert exit_info.value.code == 1
+
+
+class StopWorker(BaseException):
+    """Raised from the fake wait to leave run_worker's endless loop"""
+
+
+class FakeContext:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def connect(self):
+        return self
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_worker_ticks(monkeypatch, ticks, publish):
+    """Run run_worker for a number of waits; returns the timeout of each wait"""
+    timeouts = []
+
+    def wait_for_next_run(listener, timeout):
+        timeouts.append(timeout)
+        if len(timeouts) == ticks:
+            raise StopWorker
+        return False
+
+    monkeypatch.setattr(worker, "engine", FakeContext())
+    monkeypatch.setattr(worker, "Session", FakeContext)
+    monkeypatch.setattr(worker, "open_listener", lambda: FakeContext())
+    monkeypatch.setattr(worker, "wait_for_next_run", wait_for_next_run)
+    monkeypatch.setattr(worker, "next_publish_at", lambda db: datetime.now(timezone.utc) - timedelta(minutes=1))
+    monkeypatch.setattr(worker, "publish_scheduled_lessons", publish)
+
+    with pytest.raises(StopWorker):
+        worker.run_worker()
+    return timeouts
+
+
+def test_failed_publish_backs_off(monkeypatch):
+    timeouts = run_worker_ticks(monkeypatch, 3, lambda db, now: False)
+
+    assert timeouts == [worker.MAX_SLEEP_SECONDS] * 3
+
+
+def test_publish_error_backs_off(monkeypatch):
+    def publish(db, now):
+        raise RuntimeError("connection lost")
+
+    timeouts = run_worker_ticks(monkeypatch, 3, publish)
+
+    assert timeouts == [worker.MAX_SLEEP_SECONDS] * 3
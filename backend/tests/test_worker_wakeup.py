@@ -0,0 +1,106 @@
+"""The worker sleeps until the next lesson is due and wakes early on NOTIFY lesson_scheduled"""
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import worker
+from app.models.models import NOTIFY_LESSON_SCHEDULED, LessonStatus
+from conftest import NOW, make_lesson
+from test_worker import FakeContext, StopWorker
+
+
+class PipeListener:
+    """Stands in for the LISTEN connection: readable once something is written to the pipe"""
+    def __init__(self):
+        self._read, self._write = os.pipe()
+        self.notifies = []
+
+    def fileno(self):
+        return self._read
+
+    def notify(self):
+        os.write(self._write, b"x")
+        self.notifies.append("lesson_scheduled")
+
+    def poll(self):
+        os.read(self._read, 1)
+
+    def close(self):
+        os.close(self._read)
+        os.close(self._write)
+
+
+def test_seconds_until_is_clamped():
+    now = datetime.now(timezone.utc)
+
+    assert worker.seconds_until(None) == worker.MAX_SLEEP_SECONDS
+    assert worker.seconds_until(now - timedelta(minutes=5)) == 1
+    assert worker.seconds_until(now + timedelta(hours=1)) == worker.MAX_SLEEP_SECONDS
+    assert 25 < worker.seconds_until(now + timedelta(seconds=30)) <= 30
+
+
+def test_wait_returns_false_on_timeout():
+    listener = PipeListener()
+    try:
+        assert worker.wait_for_next_run(listener, 0.01) is False
+    finally:
+        listener.close()
+
+
+def test_wait_wakes_on_notify():
+    listener = PipeListener()
+    try:
+        listener.notify()
+
+        assert worker.wait_for_next_run(listener, 5) is True
+        assert listener.notifies == []
+    finally:
+        listener.close()
+
+
+def test_scheduling_a_lesson_notifies_the_worker(client, sync_db):
+    lesson = make_lesson(status=LessonStatus.draft, published_at=None)
+    sync_db.results.append([lesson])
+
+    response = client.post(
+        f"/api/lessons/{lesson.id}/publish", json={"action": "schedule", "publish_at": NOW.isoformat()}
+    )
+
+    assert response.status_code == 200
+    assert sync_db.executed(NOTIFY_LESSON_SCHEDULED)
+
+
+def _count_due_time_reads(monkeypatch, notified):
+    """Three waits with the next lesson 30s away; returns how often the due time was read"""
+    reads = []
+    waits = []
+
+    def next_publish_at(db):
+        reads.append(1)
+        return datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    def wait_for_next_run(listener, timeout):
+        waits.append(timeout)
+        if len(waits) == 3:
+            raise StopWorker
+        return notified
+
+    monkeypatch.setattr(worker, "engine", FakeContext())
+    monkeypatch.setattr(worker, "Session", FakeContext)
+    monkeypatch.setattr(worker, "open_listener", lambda: FakeContext())
+    monkeypatch.setattr(worker, "wait_for_next_run", wait_for_next_run)
+    monkeypatch.setattr(worker, "next_publish_at", next_publish_at)
+
+    with pytest.raises(StopWorker):
+        worker.run_worker()
+    return len(reads)
+
+
+def test_timer_wakeup_keeps_the_known_due_time(monkeypatch):
+    # Woken by the timer before anything is due: no need to re-read the lessons table
+    assert _count_due_time_reads(monkeypatch, notified=False) == 1
+
+
+def test_notify_wakeup_rereads_the_due_time(monkeypatch):
+    assert _count_due_time_reads(monkeypatch, notified=True) == 3
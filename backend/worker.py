@@ -1,85 +1,202 @@
+import os
+import select as io_select
+import sys
 import time
-from datetime import datetime
-from sqlalchemy import and_
+from datetime import datetime, timezone
+from typing import Optional
+import psycopg2
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 import logging
 
-from app.db.database import SessionLocal
-from app.models.models import Lesson, LessonStatus, Program, ProgramStatus, Term
+from app.db.database import DATABASE_URL, engine
+from app.models.models import (
+    Lesson, LessonStatus, Program, ProgramStatus, Term,
+    REFRESH_PUBLISHED_PROGRAMS, LESSON_SCHEDULED_CHANNEL, create_schema
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def publish_scheduled_lessons():
+def publish_scheduled_lessons(db: Session, now: Optional[datetime] = None) -> bool:
     """
     Worker function that publishes scheduled lessons.
     Runs every minute and is idempotent and concurrency-safe.
+    Uses the worker's long-lived session; every path ends its transaction.
+    `now` is the tick's timestamp: the due filter and every published_at use it.
+    Returns False if the batch failed (it was logged and rolled back).
     """
-    db: Session = SessionLocal()
+    if now is None:
+        now = datetime.now(timezone.utc)
     try:
-        # Find lessons ready to publish (with row locking for concurrency safety)
-        now = datetime.utcnow()
-        lessons = db.query(Lesson).filter(
-            and_(
-                Lesson.status == LessonStatus.scheduled,
-                Lesson.publish_at <= now
-            )
-        ).with_for_update(skip_locked=True).all()
+        # Claim and publish all due lessons in one atomic statement: the UPDATE locks the
+        # rows itself, and a concurrent worker re-checks status='scheduled' and skips them
+        published = db.execute(
+            update(Lesson)
+            .where(Lesson.status == LessonStatus.scheduled, Lesson.publish_at <= now)
+            .values(status=LessonStatus.published, published_at=now)
+            .returning(Lesson.id, Lesson.term_id, Lesson.title)
+            .execution_options(synchronize_session=False)
+        ).all()
         
-        if not lessons:
+        if not published:
+            db.rollback()
             logger.info("No lessons to publish")
-            return
+            return True
         
-        logger.info(f"Found {len(lessons)} lessons to publish")
+        logger.info(f"Found {len(published)} lessons to publish")
         
-        for lesson in lessons:
-            try:
-                # Publish lesson (idempotent - only set if not already published)
-                if lesson.status == LessonStatus.scheduled:
-                    lesson.status = LessonStatus.published
-                    lesson.published_at = datetime.utcnow()
-                    
-                    logger.info(f"Published lesson {lesson.id}: {lesson.title}")
-                    
-                    # Auto-publish program if this is first published lesson
-                    term = db.query(Term).filter(Term.id == lesson.term_id).first()
-                    if term:
-                        program = db.query(Program).filter(Program.id == term.program_id).first()
-                        if program and program.status == ProgramStatus.draft:
-                            program.status = ProgramStatus.published
-                            if program.published_at is None:  # Only set once
-                                program.published_at = datetime.utcnow()
-                            logger.info(f"Auto-published program {program.id}: {program.title}")
-                
-                # Commit each lesson in its own transaction for safety
-                db.commit()
-                
-            except Exception as e:
-                logger.error(f"Error publishing lesson {lesson.id}: {str(e)}")
-                db.rollback()
-                continue
+        # Auto-publish each draft program that just got its first published lesson (one UPDATE)
+        term_ids = {row.term_id for row in published}
+        auto_published = db.execute(
+            update(Program)
+            .where(
+                Program.id.in_(select(Term.program_id).where(Term.id.in_(term_ids))),
+                Program.status == ProgramStatus.draft
+            )
+            .values(status=ProgramStatus.published, published_at=func.coalesce(Program.published_at, now))
+            .returning(Program.id, Program.title)
+            .execution_options(synchronize_session=False)
+        ).all()
+        
+        # Newly published lessons/programs must show up in the public catalog
+        db.execute(REFRESH_PUBLISHED_PROGRAMS)
+        
+        # One commit for the whole batch
+        db.commit()
+        
+        for row in published:
+            logger.info(f"Published lesson {row.id}: {row.title}")
+        for row in auto_published:
+            logger.info(f"Auto-published program {row.id}: {row.title}")
+        return True
         
     except Exception as e:
         logger.error(f"Worker error: {str(e)}")
         db.rollback()
+        return False
+
+
+# Longest time between checks, even if nothing is scheduled
+MAX_SLEEP_SECONDS = 60
+
+
+def next_publish_at(db: Session) -> Optional[datetime]:
+    """Earliest publish_at among scheduled lessons (None if nothing is scheduled)"""
+    try:
+        return db.scalar(
+            select(func.min(Lesson.publish_at)).where(Lesson.status == LessonStatus.scheduled)
+        )
     finally:
-        db.close()
+        db.rollback()  # don't sit "idle in transaction" between ticks
+
+
+def seconds_until(next_at: Optional[datetime]) -> float:
+    """How long to wait for next_at (1..MAX_SLEEP_SECONDS)"""
+    if next_at is None:
+        return MAX_SLEEP_SECONDS
+    seconds = (next_at - datetime.now(timezone.utc)).total_seconds()
+    return min(MAX_SLEEP_SECONDS, max(1, seconds))
+
+
+def open_listener():
+    """Dedicated autocommit connection that LISTENs for newly scheduled lessons"""
+    conn = psycopg2.connect(DATABASE_URL)
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f"LISTEN {LESSON_SCHEDULED_CHANNEL}")
+    return conn
+
+
+def wait_for_next_run(listener, timeout: float) -> bool:
+    """Sleep until the timeout, or until the API NOTIFYs that a lesson was scheduled (returns True)"""
+    readable, _, _ = io_select.select([listener], [], [], timeout)
+    if readable:
+        listener.poll()
+        listener.notifies.clear()
+    return bool(readable)
 
 
 def run_worker():
-    """Main worker loop"""
+    """
+    Main worker loop
+    Keeps the next due time in memory and only touches the lessons table when it
+    has passed; it is re-read on startup, after a NOTIFY, after publishing, and
+    after each idle MAX_SLEEP_SECONDS wait (to catch lessons scheduled outside the API)
+    """
     logger.info("Starting scheduled publishing worker...")
-    logger.info("Worker will run every 60 seconds")
+    logger.info(f"Worker wakes when the next lesson is due (at least every {MAX_SLEEP_SECONDS}s)")
     
-    while True:
+    # One session on one checked-out connection for the worker's whole life (no pool
+    # checkout / reconnect per tick); after a disconnect the next rollback reconnects it.
+    # Every write is an explicit UPDATE, so the session never autoflushes or expires
+    # objects, whatever the API's session defaults are
+    listener = None
+    next_at = None
+    refresh_next_at = True
+    with engine.connect() as connection, \
+            Session(bind=connection, autoflush=False, expire_on_commit=False) as db:
         try:
-            publish_scheduled_lessons()
-        except Exception as e:
-            logger.error(f"Unexpected error in worker: {str(e)}")
-        
-        time.sleep(60)  # Run every minute
+            while True:
+                try:
+                    if refresh_next_at:
+                        next_at = next_publish_at(db)
+                    now = datetime.now(timezone.utc)  # one clock read per tick
+                    if next_at is not None and next_at <= now:
+                        if publish_scheduled_lessons(db, now):
+                            next_at = next_publish_at(db)
+                        else:
+                            # Failed (logged, rolled back): next_at is still in the past, so back
+                            # off for a full MAX_SLEEP_SECONDS instead of retrying every second
+                            next_at = None
+                except Exception as e:
+                    logger.error(f"Unexpected error in worker: {str(e)}")
+                    db.rollback()
+                    next_at = None  # same back-off
+                
+                try:
+                    if listener is None:
+                        listener = open_listener()
+                    timeout = seconds_until(next_at)
+                    notified = wait_for_next_run(listener, timeout)
+                    # Woken only because next_at arrived: it's still valid, go straight to publishing
+                    refresh_next_at = notified or timeout == MAX_SLEEP_SECONDS
+                except Exception as e:
+                    # Fall back to plain polling until the database is reachable again
+                    logger.error(f"Wakeup error, polling instead: {str(e)}")
+                    if listener is not None:
+                        listener.close()
+                        listener = None
+                    time.sleep(MAX_SLEEP_SECONDS)
+                    refresh_next_at = True
+        finally:
+            if listener is not None:
+                listener.close()
+
+
+def run_once():
+    """
+    Single publishing pass for cron / scheduled jobs (python worker.py --oneshot)
+    Holds a connection only while it runs, instead of for the life of a process
+    Exits with status 1 if the pass failed, so cron / the platform can report it
+    """
+    try:
+        with Session(bind=engine, autoflush=False, expire_on_commit=False) as db:
+            ok = publish_scheduled_lessons(db)
+    except Exception:
+        logger.exception("One-shot publishing run failed")
+        ok = False
+    finally:
+        engine.dispose()
+    sys.exit(0 if ok else 1)
 
 
 if __name__ == "__main__":
-    run_worker()
+    # The worker is a single process, so it's the one place deployments create the schema
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        create_schema(engine)
+    if "--oneshot" in sys.argv:
+        run_once()
+    else:
+        run_worker()
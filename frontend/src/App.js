@@ -77,6 +77,19 @@ function App() {
     return response.json();
   }
 
+  // Fetch every page of a paginated list endpoint (the API caps each page at 200)
+  const PAGE_SIZE = 200;
+  async function callAPIAll(url) {
+    const items = [];
+    const separator = url.includes('?') ? '&' : '?';
+    for (let offset = 0; ; offset += PAGE_SIZE) {
+      const page = await callAPI(`${url}${separator}limit=${PAGE_SIZE}&offset=${offset}`);
+      if (!Array.isArray(page)) return items;
+      items.push(...page);
+      if (page.length < PAGE_SIZE) return items;
+    }
+  }
+
   // Check auth on load
   useEffect(() => {
     const token = localStorage.getItem('token');
@@ -122,7 +135,7 @@ function App() {
   async function loadPrograms() {
     setLoading(true);
     try {
-      const data = await callAPI('/api/programs');
+      const data = await callAPIAll('/api/programs');
       setPrograms(Array.isArray(data) ? data : []);
     } catch (err) {
       console.error('Error loading programs:', err);
@@ -134,7 +147,7 @@ function App() {
 
   async function loadTopics() {
     try {
-      const data = await callAPI('/api/topics');
+      const data = await callAPIAll('/api/topics');
       setTopics(Array.isArray(data) ? data : []);
     } catch (err) {
       console.error('Error loading topics:', err);
@@ -159,10 +172,10 @@ function App() {
     setLoading(true);
     try {
       const program = await callAPI(`/api/programs/${programId}`);
-      const terms = await callAPI(`/api/programs/${programId}/terms`);
+      const terms = await callAPIAll(`/api/programs/${programId}/terms`);
 
       for (let term of terms) {
-        const lessons = await callAPI(`/api/terms/${term.id}/lessons`);
+        const lessons = await callAPIAll(`/api/terms/${term.id}/lessons`);
         term.lessons = Array.isArray(lessons) ? lessons : [];
       }
 